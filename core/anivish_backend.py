@@ -1,5 +1,17 @@
+import inspect
+import queue
+import threading
+import weakref
 import vlc
-from typing import Optional, List, Tuple
+from collections import defaultdict
+from typing import Optional, List, Tuple, Callable, Dict
+
+from core.logger import get_logger
+
+logger = get_logger("backend")
+
+# libvlc 4 bindings take a b_fast flag on set_time (keyframe seek); libvlc 3 does not
+_SET_TIME_SUPPORTS_FAST = len(inspect.signature(vlc.MediaPlayer.set_time).parameters) > 2
 
 
 class AniVishBackend:
@@ -8,14 +20,109 @@ class AniVishBackend:
     Exposes a clean API for playback controls, audio management, and media handling.
     """
 
+    # libVLC instance shared by every backend (plugin cache is loaded once)
+    VLC_INSTANCE_ARGS = ("--no-video-title-show", "--quiet")
+    _shared_instance: Optional[vlc.Instance] = None
+    _shared_refcount: int = 0
+    _shared_lock = threading.Lock()
+
+    # Seeks arriving within this window are coalesced (seek-bar drags)
+    SEEK_COALESCE_MS = 30
+
+    # VLC state -> state string
+    _STATE_MAP = {
+        vlc.State.Playing: "playing",
+        vlc.State.Paused: "paused",
+        vlc.State.Stopped: "stopped",
+        vlc.State.Ended: "ended",
+        vlc.State.Error: "error",
+        vlc.State.Opening: "opening",
+        vlc.State.Buffering: "buffering",
+        vlc.State.NothingSpecial: "idle",
+    }
+
+    # Events the backend always listens to, to keep time/length/track caches current
+    _CACHED_EVENTS = (
+        vlc.EventType.MediaPlayerTimeChanged,
+        vlc.EventType.MediaPlayerLengthChanged,
+        vlc.EventType.MediaPlayerESAdded,
+        vlc.EventType.MediaPlayerESDeleted,
+    )
+
+    # Events whose payload points into libvlc-owned memory (media, strings)
+    # that is freed once the native callback returns; on_event rejects them
+    # since subscribers run later, on the dispatcher thread
+    _POINTER_PAYLOAD_EVENTS = frozenset(
+        event_type for event_type in (
+            getattr(vlc.EventType, name, None) for name in (
+                'MediaPlayerMediaChanged',
+                'MediaPlayerSnapshotTaken',
+                'MediaPlayerAudioDevice',
+                'MediaPlayerTitleSelectionChanged',
+            )
+        ) if event_type is not None
+    )
+
     def __init__(self):
-        # Create VLC instance with default args
-        self.instance = vlc.Instance()
+        # Acquire the process-wide VLC instance
+        self.instance = AniVishBackend._get_shared_instance()
         # Create main media player
         self.player = self.instance.media_player_new()
-        # Track mute state (VLC doesn't have a simple toggle)
-        self._muted = False
-        self._pre_mute_volume = 100
+        # Current media and its parsed metadata (filled asynchronously)
+        self._media: Optional[vlc.Media] = None
+        self._media_info_cache: Optional[dict] = None
+        self._duration_ms = -1
+        # Latest playback time, pushed by MediaPlayerTimeChanged
+        self._last_time_ms = -1
+        # Decoded track lists for the current media
+        self._audio_tracks_cache: Optional[List[Tuple[int, str]]] = None
+        self._subtitle_tracks_cache: Optional[List[Tuple[int, str]]] = None
+        # on_event subscribers, fanned out from one VLC callback per event type
+        self._dispatch: Dict[vlc.EventType, List[Callable]] = defaultdict(list)
+        self._dispatch_lock = threading.Lock()
+        self._event_queue: queue.Queue = queue.Queue()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Private event manager wrapper: python-vlc keeps one callback per event
+        # type per wrapper, and player.event_manager() is shared with other users
+        self._event_manager = vlc.libvlc_media_player_event_manager(self.player)
+        for event_type in self._CACHED_EVENTS:
+            self._event_manager.event_attach(event_type, self._on_native_event, event_type)
+        # Latest coalesced seek, applied when the timer fires
+        self._pending_seek: Optional[Callable[[], None]] = None
+        self._seek_timer: Optional[threading.Timer] = None
+        self._seek_lock = threading.Lock()
+        self._released = False  # Set under _seek_lock; no seeks apply after it
+        # Releases VLC resources when the backend is collected or release() is called
+        # Media whose MediaParsedChanged listener is attached; shared with
+        # the finalizer so cleanup can detach it without referencing self
+        self._parsed_media: List[vlc.Media] = []
+        self._finalizer = weakref.finalize(
+            self, AniVishBackend._cleanup, self.player, self._event_queue,
+            self._parsed_media
+        )
+
+    @classmethod
+    def _get_shared_instance(cls) -> vlc.Instance:
+        """
+        Get the shared VLC instance, creating it on first use.
+        Each call takes a reference that must be returned via _release_shared_instance().
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = vlc.Instance(*cls.VLC_INSTANCE_ARGS)
+            cls._shared_refcount += 1
+            return cls._shared_instance
+
+    @classmethod
+    def _release_shared_instance(cls):
+        """Drop one reference to the shared VLC instance, releasing it at zero."""
+        with cls._shared_lock:
+            if cls._shared_refcount <= 0:
+                return
+            cls._shared_refcount -= 1
+            if cls._shared_refcount == 0 and cls._shared_instance is not None:
+                cls._shared_instance.release()
+                cls._shared_instance = None
 
     # ==========================================
     # Media Loading
@@ -35,11 +142,54 @@ class AniVishBackend:
             media = self.instance.media_new(path)
             if media is None:
                 return False
+            self._media_info_cache = None
+            self._duration_ms = -1
+            self._last_time_ms = -1
+            self._audio_tracks_cache = None
+            self._subtitle_tracks_cache = None
+            self._media = media
+            self._detach_media_parsed(self._parsed_media)
+            # Parse metadata in the background; result is cached on completion.
+            # Media event managers are memoized module-wide by python-vlc, so
+            # the listener only holds a weak reference to the backend
+            media.event_manager().event_attach(
+                vlc.EventType.MediaParsedChanged,
+                AniVishBackend._on_media_parsed, weakref.ref(self), media
+            )
+            self._parsed_media.append(media)
+            media.parse_with_options(vlc.MediaParseFlag.local, -1)
             self.player.set_media(media)
             return True
         except Exception:
             return False
 
+    @staticmethod
+    def _on_media_parsed(event, backend_ref, media):
+        """Cache metadata once VLC finishes parsing the media."""
+        backend = backend_ref()
+        if backend is not None and media is backend._media:
+            backend._cache_media_info(media)
+
+    @staticmethod
+    def _detach_media_parsed(parsed_media: list):
+        """Detach the MediaParsedChanged listener from previously loaded media."""
+        while parsed_media:
+            media = parsed_media.pop()
+            try:
+                media.event_manager().event_detach(vlc.EventType.MediaParsedChanged)
+            except Exception:
+                pass
+
+    def _cache_media_info(self, media) -> dict:
+        """Build and store the static part of the media info."""
+        duration = media.get_duration()
+        if duration > 0:
+            self._duration_ms = duration
+        # Duration is not cached here: streams skip the local parse and
+        # only learn their length from LengthChanged during playback
+        self._media_info_cache = {"mrl": media.get_mrl()}
+        return self._media_info_cache
+
     def get_media_info(self) -> Optional[dict]:
         """
         Get information about the currently loaded media.
@@ -51,12 +201,17 @@ class AniVishBackend:
         if media is None:
             return None
         
-        media.parse()
-        return {
-            "mrl": media.get_mrl(),
-            "duration_ms": media.get_duration(),
-            "state": str(self.player.get_state()),
-        }
+        info = self._media_info_cache
+        if info is None:
+            # Background parse not finished yet - parse synchronously once
+            media.parse()
+            info = self._cache_media_info(media)
+        
+        return dict(
+            info,
+            duration_ms=self.get_total_duration(),
+            state=str(self.player.get_state()),
+        )
 
     # ==========================================
     # Playback Controls API
@@ -78,22 +233,56 @@ class AniVishBackend:
     def stop(self):
         """Stop playback completely."""
         self.player.stop()
+        self._last_time_ms = -1
 
-    def seek(self, position_ms: int):
+    def seek(self, position_ms: int, precise: bool = True):
         """
         Seek to a specific position in milliseconds.
         
+        The seek is applied SEEK_COALESCE_MS after the first of a burst; newer
+        seeks arriving in the meantime replace it, so dragging a seek bar
+        doesn't flood libvlc.
+        Use seek_immediate() when the seek must happen right away.
+        
         Args:
             position_ms: Target position in milliseconds
+            precise: If False, land on the nearest keyframe instead of decoding
+                     up to the exact frame (faster, less accurate). Only honored
+                     by libvlc 4; older versions always seek precisely.
         """
-        self.player.set_time(position_ms)
+        self._schedule_seek(lambda: self._set_time(position_ms, precise))
 
-    def seek_relative(self, offset_ms: int):
+    def seek_immediate(self, position_ms: int, precise: bool = True):
+        """
+        Seek to a specific position in milliseconds without coalescing.
+        Discards any pending coalesced seek.
+        
+        Args:
+            position_ms: Target position in milliseconds
+            precise: Seek to the exact frame instead of the nearest keyframe
+        """
+        self._cancel_pending_seek()
+        self._set_time(position_ms, precise)
+
+    def _set_time(self, position_ms: int, precise: bool):
+        """Issue the actual libvlc seek."""
+        if not precise and _SET_TIME_SUPPORTS_FAST:
+            self.player.set_time(position_ms, True)
+        else:
+            self.player.set_time(position_ms)
+        # Keep the cache right until the next TimeChanged (e.g. while paused)
+        self._last_time_ms = position_ms
+
+    def seek_relative(self, offset_ms: int, precise: bool = False):
         """
         Seek relative to current position.
         
+        Defaults to keyframe seeking, which keeps rapid skips responsive at
+        the cost of landing up to one GOP away from the exact target.
+        
         Args:
             offset_ms: Offset in milliseconds (positive = forward, negative = backward)
+            precise: Seek to the exact frame instead of the nearest keyframe
         """
         current = self.get_current_time()
         if current >= 0:
@@ -101,34 +290,107 @@ class AniVishBackend:
             total = self.get_total_duration()
             if total > 0:
                 new_pos = min(new_pos, total)
-            self.seek(new_pos)
+            self.seek_immediate(new_pos, precise)
 
-    def get_current_time(self) -> int:
+    def get_current_time(self, refresh: bool = False) -> int:
         """
         Get current playback position in milliseconds.
         
+        Served from the value cached by VLC's TimeChanged event; libvlc is
+        only queried when nothing is cached yet or refresh is requested.
+        
+        Args:
+            refresh: Query libvlc directly instead of using the cached value
+        
         Returns:
             Current time in ms, or -1 if not available
         """
-        return self.player.get_time()
+        if refresh or self._last_time_ms < 0:
+            self._last_time_ms = self.player.get_time()
+        return self._last_time_ms
 
-    def get_total_duration(self) -> int:
+    def get_total_duration(self, refresh: bool = False) -> int:
         """
         Get total duration of current media in milliseconds.
         
+        Served from the value cached by parsing or VLC's LengthChanged event;
+        libvlc is only queried until the duration is known.
+        
+        Args:
+            refresh: Query libvlc directly instead of using the cached value
+        
         Returns:
             Duration in ms, or -1 if not available
         """
-        return self.player.get_length()
+        if refresh or self._duration_ms <= 0:
+            duration = self.player.get_length()
+            if duration <= 0:
+                return duration
+            self._duration_ms = duration
+        return self._duration_ms
 
     def set_position(self, value: float):
         """
         Set playback position as a fraction (0.0 to 1.0).
         
+        Coalesced like seek(); use set_position_immediate() to skip that.
+        
+        Args:
+            value: Position fraction (0.0 = start, 1.0 = end)
+        """
+        value = max(0.0, min(1.0, value))
+        self._schedule_seek(lambda: self._set_position(value))
+
+    def set_position_immediate(self, value: float):
+        """
+        Set playback position as a fraction without coalescing.
+        Discards any pending coalesced seek.
+        
         Args:
             value: Position fraction (0.0 = start, 1.0 = end)
         """
-        self.player.set_position(max(0.0, min(1.0, value)))
+        self._cancel_pending_seek()
+        self._set_position(max(0.0, min(1.0, value)))
+
+    def _set_position(self, value: float):
+        """Issue the actual libvlc position change."""
+        self.player.set_position(value)
+        duration = self.get_total_duration()
+        # Unknown duration: drop the cached time so the next read queries libvlc
+        self._last_time_ms = int(value * duration) if duration > 0 else -1
+
+    def _schedule_seek(self, apply_seek: Callable[[], None]):
+        """Make apply_seek the pending seek, arming the coalescing timer if idle."""
+        with self._seek_lock:
+            if self._released:
+                return
+            self._pending_seek = apply_seek
+            # A burst of seeks shares one timer thread; it applies whichever
+            # seek is pending when it fires
+            if self._seek_timer is None:
+                self._seek_timer = threading.Timer(
+                    self.SEEK_COALESCE_MS / 1000, self._commit_seek
+                )
+                self._seek_timer.daemon = True
+                self._seek_timer.start()
+
+    def _commit_seek(self):
+        """Timer callback: apply the most recent pending seek."""
+        # Applied under the lock so release() cannot free the player mid-seek
+        with self._seek_lock:
+            apply_seek = self._pending_seek
+            self._pending_seek = None
+            self._seek_timer = None
+            if apply_seek is not None and not self._released:
+                apply_seek()
+
+    def _cancel_pending_seek(self):
+        """Drop any pending coalesced seek."""
+        with self._seek_lock:
+            self._pending_seek = None
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+                self._seek_timer = None
 
     def get_position(self) -> float:
         """
@@ -168,18 +430,7 @@ class AniVishBackend:
         Returns:
             State string: 'playing', 'paused', 'stopped', 'ended', 'error', or 'unknown'
         """
-        state = self.player.get_state()
-        state_map = {
-            vlc.State.Playing: "playing",
-            vlc.State.Paused: "paused",
-            vlc.State.Stopped: "stopped",
-            vlc.State.Ended: "ended",
-            vlc.State.Error: "error",
-            vlc.State.Opening: "opening",
-            vlc.State.Buffering: "buffering",
-            vlc.State.NothingSpecial: "idle",
-        }
-        return state_map.get(state, "unknown")
+        return self._STATE_MAP.get(self.player.get_state(), "unknown")
 
     # ==========================================
     # Audio Subsystem
@@ -195,7 +446,7 @@ class AniVishBackend:
         vol = max(0, min(100, vol))
         self.player.audio_set_volume(vol)
         if vol > 0:
-            self._muted = False
+            self.player.audio_set_mute(False)
 
     def get_volume(self) -> int:
         """
@@ -207,28 +458,21 @@ class AniVishBackend:
         return self.player.audio_get_volume()
 
     def mute(self):
-        """Mute audio (preserves volume level for unmute)."""
-        if not self._muted:
-            self._pre_mute_volume = self.get_volume()
-            self.player.audio_set_volume(0)
-            self._muted = True
+        """Mute audio (VLC preserves volume level for unmute)."""
+        self.player.audio_set_mute(True)
 
     def unmute(self):
-        """Unmute audio (restores previous volume level)."""
-        if self._muted:
-            self.player.audio_set_volume(self._pre_mute_volume)
-            self._muted = False
+        """Unmute audio."""
+        self.player.audio_set_mute(False)
 
     def toggle_mute(self):
         """Toggle mute state."""
-        if self._muted:
-            self.unmute()
-        else:
-            self.mute()
+        self.player.audio_toggle_mute()
 
     def is_muted(self) -> bool:
         """Check if audio is muted."""
-        return self._muted
+        # audio_get_mute returns -1 when there is no audio output
+        return self.player.audio_get_mute() == 1
 
     def get_audio_tracks(self) -> List[Tuple[int, str]]:
         """
@@ -237,12 +481,21 @@ class AniVishBackend:
         Returns:
             List of (track_id, track_name) tuples
         """
-        tracks = []
-        track_desc = self.player.audio_get_track_description()
-        if track_desc:
-            for track in track_desc:
-                tracks.append((track[0], track[1].decode('utf-8') if isinstance(track[1], bytes) else track[1]))
-        return tracks
+        if self._audio_tracks_cache is None:
+            tracks = self._decode_tracks(self.player.audio_get_track_description())
+            # Tracks only appear once the demuxer opens the media
+            if not tracks:
+                return tracks
+            self._audio_tracks_cache = tracks
+        return list(self._audio_tracks_cache)
+
+    @staticmethod
+    def _decode_tracks(track_desc) -> List[Tuple[int, str]]:
+        """Convert a VLC track description list to (track_id, track_name) tuples."""
+        return [
+            (t[0], t[1].decode('utf-8') if isinstance(t[1], bytes) else t[1])
+            for t in (track_desc or ())
+        ]
 
     def get_current_audio_track(self) -> int:
         """
@@ -294,13 +547,12 @@ class AniVishBackend:
         Returns:
             List of (track_id, track_name) tuples
         """
-        tracks = []
-        track_desc = self.player.video_get_spu_description()
-        if track_desc:
-            for track in track_desc:
-                name = track[1].decode('utf-8') if isinstance(track[1], bytes) else track[1]
-                tracks.append((track[0], name))
-        return tracks
+        if self._subtitle_tracks_cache is None:
+            tracks = self._decode_tracks(self.player.video_get_spu_description())
+            if not tracks:
+                return tracks
+            self._subtitle_tracks_cache = tracks
+        return list(self._subtitle_tracks_cache)
 
     def get_current_subtitle_track(self) -> int:
         """
@@ -333,6 +585,8 @@ class AniVishBackend:
         Returns:
             True if loaded successfully
         """
+        # New external track will show up in the description list
+        self._subtitle_tracks_cache = None
         return self.player.video_set_subtitle_file(path)
 
     def get_subtitle_delay(self) -> int:
@@ -401,12 +655,40 @@ class AniVishBackend:
         """
         Attach a callback to a VLC event.
         
+        Only one native callback is attached per event type; it queues the
+        event and returns immediately, so libvlc's event thread never waits
+        on Python code. Callbacks run on a background dispatcher thread and
+        receive a copy of the event, so only events with scalar payloads
+        (times, positions, track ids, ...) are supported. Events carrying
+        pointers (media, file names) are rejected: libvlc frees that data
+        before the callback runs. Attach those to get_event_manager() instead.
+        
         Args:
             event_type: vlc.EventType (e.g., vlc.EventType.MediaPlayerTimeChanged)
             callback: Function to call when event fires
-        """
-        em = self.get_event_manager()
-        em.event_attach(event_type, callback)
+            
+        Raises:
+            ValueError: If the event's payload is a pointer
+        """
+        if event_type in self._POINTER_PAYLOAD_EVENTS:
+            raise ValueError(f"{event_type} carries a pointer payload; use get_event_manager()")
+        with self._dispatch_lock:
+            subscribers = self._dispatch[event_type]
+            if not subscribers and event_type not in self._CACHED_EVENTS:
+                self._event_manager.event_attach(
+                    event_type, self._on_native_event, event_type
+                )
+            subscribers.append(callback)
+            
+            if self._dispatch_thread is None:
+                # Thread must not reference self, or the finalizer could never run
+                self._dispatch_thread = threading.Thread(
+                    target=AniVishBackend._dispatch_events,
+                    args=(self._event_queue, self._dispatch, self._dispatch_lock),
+                    name="anivish-vlc-events",
+                    daemon=True,
+                )
+                self._dispatch_thread.start()
 
     def detach_event(self, event_type, callback):
         """
@@ -416,8 +698,50 @@ class AniVishBackend:
             event_type: vlc.EventType
             callback: Previously attached callback function
         """
-        em = self.get_event_manager()
-        em.event_detach(event_type, callback)
+        with self._dispatch_lock:
+            subscribers = self._dispatch.get(event_type)
+            if not subscribers or callback not in subscribers:
+                return
+            subscribers.remove(callback)
+            if not subscribers:
+                del self._dispatch[event_type]
+                if event_type not in self._CACHED_EVENTS:
+                    self._event_manager.event_detach(event_type)
+
+    def _on_native_event(self, event, event_type):
+        """Native VLC callback: update caches and hand the event to the dispatcher."""
+        if event_type == vlc.EventType.MediaPlayerTimeChanged:
+            self._last_time_ms = event.u.new_time
+        elif event_type == vlc.EventType.MediaPlayerLengthChanged:
+            if event.u.new_length > 0:
+                self._duration_ms = event.u.new_length
+        elif event_type in (vlc.EventType.MediaPlayerESAdded,
+                            vlc.EventType.MediaPlayerESDeleted):
+            # Elementary streams come and go asynchronously (external subtitle
+            # files, streams adding tracks mid-playback)
+            self._audio_tracks_cache = None
+            self._subtitle_tracks_cache = None
+        
+        if event_type in self._dispatch:
+            # The event struct is owned by libvlc and only valid during this call.
+            # The copy is shallow, which is why on_event only takes scalar payloads
+            self._event_queue.put_nowait((event_type, type(event).from_buffer_copy(event)))
+
+    @staticmethod
+    def _dispatch_events(event_queue: queue.Queue, dispatch: dict, lock: threading.Lock):
+        """Dispatcher thread: deliver queued events to subscribers."""
+        while True:
+            item = event_queue.get()
+            if item is None:
+                break
+            event_type, event = item
+            with lock:
+                subscribers = tuple(dispatch.get(event_type, ()))
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Event callback error for {event_type}: {e}")
 
     # ==========================================
     # Cleanup
@@ -425,13 +749,24 @@ class AniVishBackend:
 
     def release(self):
         """Release VLC resources. Call when done with the player."""
-        self.stop()
-        self.player.release()
-        self.instance.release()
-
-    def __del__(self):
-        """Destructor - ensure resources are released."""
-        try:
-            self.release()
-        except Exception:
-            pass
\ No newline at end of file
+        if not self._finalizer.alive:
+            return
+        # Waits for a coalesced seek that is already being applied
+        with self._seek_lock:
+            self._released = True
+            self._pending_seek = None
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+                self._seek_timer = None
+            self._finalizer()
+        self.player = None
+        self.instance = None
+
+    @staticmethod
+    def _cleanup(player, event_queue: queue.Queue, parsed_media: list):
+        """Stop and release the player, then drop the shared instance reference."""
+        event_queue.put(None)  # Stop the dispatcher thread, if running
+        AniVishBackend._detach_media_parsed(parsed_media)
+        player.stop()
+        player.release()
+        AniVishBackend._release_shared_instance()
\ No newline at end of file
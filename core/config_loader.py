@@ -1,15 +1,18 @@
 import json
+import logging
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Dict
-from dataclasses import dataclass, field, asdict
+from typing import Any, Optional, Dict, Tuple
+from dataclasses import dataclass, field, fields
 
 from core.logger import get_logger
 
 logger = get_logger("config")
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybackConfig:
     """Playback-related settings."""
     default_volume: int = 100
@@ -18,9 +21,10 @@ class PlaybackConfig:
     skip_interval_short: int = 10000  # ms
     skip_interval_long: int = 60000   # ms
     auto_play_next: bool = False
+    time_event_min_interval_ms: int = 100  # Min time change between on_time_changed events
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Audio-related settings."""
     preferred_audio_track: int = -1  # -1 = auto/default
@@ -28,7 +32,7 @@ class AudioConfig:
     normalize_audio: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleConfig:
     """Subtitle-related settings."""
     enabled: bool = True
@@ -39,7 +43,7 @@ class SubtitleConfig:
     background_opacity: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     """UI-related settings."""
     theme: str = "dark"
@@ -50,7 +54,7 @@ class UIConfig:
     controls_timeout_ms: int = 3000
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging-related settings."""
     level: str = "INFO"
@@ -58,7 +62,7 @@ class LoggingConfig:
     log_directory: str = "./logs"
 
 
-@dataclass
+@dataclass(slots=True)
 class AniVishConfig:
     """Root configuration container."""
     playback: PlaybackConfig = field(default_factory=PlaybackConfig)
@@ -67,11 +71,46 @@ class AniVishConfig:
     ui: UIConfig = field(default_factory=UIConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     
-    # Recent files list
-    recent_files: list = field(default_factory=list)
+    # Recent files, keyed by path in least-to-most-recent order
+    # (serialized as a most-recent-first list)
+    recent_files: dict = field(default_factory=dict)
     max_recent_files: int = 10
 
 
+# Config section name -> section dataclass
+_SECTION_FACTORIES = {
+    'playback': PlaybackConfig,
+    'audio': AudioConfig,
+    'subtitle': SubtitleConfig,
+    'ui': UIConfig,
+    'logging': LoggingConfig,
+}
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """Resolve (and create) the per-user config directory once per process."""
+    if os.name == 'nt':  # Windows
+        base = Path(os.environ.get('APPDATA', '.'))
+    else:  # Linux/macOS
+        base = Path.home() / '.config'
+    
+    config_dir = base / 'anivish'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Get (and cache) the field names of a config dataclass."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _section_to_dict(section) -> dict:
+    """Shallow dataclass-to-dict conversion (section values are plain scalars)."""
+    return {name: getattr(section, name) for name in _field_names(type(section))}
+
+
 class ConfigLoader:
     """
     Configuration loader and manager.
@@ -79,6 +118,7 @@ class ConfigLoader:
     """
     
     DEFAULT_CONFIG_FILENAME = "anivish_config.json"
+    SAVE_DEBOUNCE_S = 0.5  # Coalesce rapid set() calls into one write
     
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -90,6 +130,8 @@ class ConfigLoader:
         self._config_path = self._resolve_config_path(config_path)
         self._config = AniVishConfig()
         self._dirty = False
+        self._save_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
         
         # Load existing config or create default
         self._load()
@@ -100,29 +142,19 @@ class ConfigLoader:
             return Path(config_path)
         
         # Default: user's config directory or app directory
-        if os.name == 'nt':  # Windows
-            base = Path(os.environ.get('APPDATA', '.'))
-        else:  # Linux/macOS
-            base = Path.home() / '.config'
-        
-        config_dir = base / 'anivish'
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / self.DEFAULT_CONFIG_FILENAME
+        return _default_config_dir() / self.DEFAULT_CONFIG_FILENAME
     
     def _load(self):
         """Load configuration from file."""
-        if not self._config_path.exists():
-            logger.info(f"No config file found, using defaults: {self._config_path}")
-            self._save()  # Create default config file
-            return
-        
         try:
-            with open(self._config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = json.loads(self._config_path.read_bytes())
             self._config = self._dict_to_config(data)
             logger.info(f"Loaded config from: {self._config_path}")
             
+        except FileNotFoundError:
+            logger.info(f"No config file found, using defaults: {self._config_path}")
+            self._config = AniVishConfig()
+            self._save(pretty=True)  # Create default config file
         except json.JSONDecodeError as e:
             logger.error(f"Invalid config JSON: {e}. Using defaults.")
             self._config = AniVishConfig()
@@ -130,47 +162,64 @@ class ConfigLoader:
             logger.error(f"Failed to load config: {e}. Using defaults.")
             self._config = AniVishConfig()
     
-    def _save(self):
-        """Save configuration to file."""
-        try:
-            data = self._config_to_dict(self._config)
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            
-            self._dirty = False
-            logger.debug(f"Saved config to: {self._config_path}")
-            
-        except Exception as e:
-            logger.error(f"Failed to save config: {e}")
+    def _save(self, pretty: bool = False):
+        """
+        Save configuration to file.
+        
+        Writes to a temp file and swaps it in with os.replace, so a crash
+        mid-write never leaves a truncated config behind.
+        
+        Args:
+            pretty: Indent the JSON (compact otherwise)
+        """
+        with self._save_lock:
+            self._cancel_scheduled_save()
+            tmp_path = self._config_path.with_suffix('.json.tmp')
+            try:
+                data = self._config_to_dict(self._config)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2 if pretty else None)
+                os.replace(tmp_path, self._config_path)
+                
+                self._dirty = False
+                logger.debug(f"Saved config to: {self._config_path}")
+                
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+    
+    def _schedule_save(self):
+        """Save after SAVE_DEBOUNCE_S, restarting the delay on each call."""
+        with self._save_lock:
+            self._cancel_scheduled_save()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_S, self.save_if_dirty)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _cancel_scheduled_save(self):
+        """Cancel a pending debounced save, if any."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
     
     def _config_to_dict(self, config: AniVishConfig) -> dict:
         """Convert config dataclass to dictionary."""
-        return {
-            'playback': asdict(config.playback),
-            'audio': asdict(config.audio),
-            'subtitle': asdict(config.subtitle),
-            'ui': asdict(config.ui),
-            'logging': asdict(config.logging),
-            'recent_files': config.recent_files,
-            'max_recent_files': config.max_recent_files
-        }
+        data = {name: _section_to_dict(getattr(config, name)) for name in _SECTION_FACTORIES}
+        data['recent_files'] = list(reversed(config.recent_files))
+        data['max_recent_files'] = config.max_recent_files
+        return data
     
     def _dict_to_config(self, data: dict) -> AniVishConfig:
         """Convert dictionary to config dataclass."""
         config = AniVishConfig()
         
-        if 'playback' in data:
-            config.playback = PlaybackConfig(**data['playback'])
-        if 'audio' in data:
-            config.audio = AudioConfig(**data['audio'])
-        if 'subtitle' in data:
-            config.subtitle = SubtitleConfig(**data['subtitle'])
-        if 'ui' in data:
-            config.ui = UIConfig(**data['ui'])
-        if 'logging' in data:
-            config.logging = LoggingConfig(**data['logging'])
+        for section, factory in _SECTION_FACTORIES.items():
+            raw = data.get(section)
+            if raw:
+                # Ignore keys from other versions instead of failing the whole load
+                known = {name: raw[name] for name in _field_names(factory) if name in raw}
+                setattr(config, section, factory(**known))
         if 'recent_files' in data:
-            config.recent_files = data['recent_files']
+            config.recent_files = dict.fromkeys(reversed(data['recent_files']))
         if 'max_recent_files' in data:
             config.max_recent_files = data['max_recent_files']
         
@@ -235,18 +284,55 @@ class ConfigLoader:
         """
         section_obj = getattr(self._config, section, None)
         if section_obj and hasattr(section_obj, key):
+            # Re-setting the current value (e.g. a settings form applied
+            # unchanged) neither dirties the config nor schedules a write
+            if getattr(section_obj, key) == value:
+                return
             setattr(section_obj, key, value)
             self._dirty = True
-            logger.debug(f"Config updated: {section}.{key} = {value}")
-    
-    def save(self):
-        """Save current configuration to file."""
-        self._save()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Config updated: {section}.{key} = {value}")
+            self._schedule_save()
+
+    def update_many(self, changes: Dict[Tuple[str, str], Any]):
+        """
+        Set several config values at once.
+
+        Unknown sections/keys are ignored and unchanged values are skipped,
+        as in set(); the config is marked dirty and a save scheduled once.
+
+        Args:
+            changes: Mapping of (section, key) to new value
+        """
+        changed = False
+        for (section, key), value in changes.items():
+            section_obj = getattr(self._config, section, None)
+            if section_obj is None or not hasattr(section_obj, key):
+                continue
+            if getattr(section_obj, key) != value:
+                setattr(section_obj, key, value)
+                changed = True
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Config updated: {section}.{key} = {value}")
+
+        if changed:
+            self._dirty = True
+            self._schedule_save()
+
+    def save(self, pretty: bool = True):
+        """
+        Save current configuration to file.
+        
+        Args:
+            pretty: Indent the JSON for hand editing
+        """
+        self._save(pretty)
     
     def save_if_dirty(self):
         """Save only if config has been modified."""
-        if self._dirty:
-            self._save()
+        with self._save_lock:
+            if self._dirty:
+                self._save()
     
     def reload(self):
         """Reload configuration from file."""
@@ -260,15 +346,9 @@ class ConfigLoader:
     
     def reset_section(self, section: str):
         """Reset a specific section to defaults."""
-        defaults = {
-            'playback': PlaybackConfig(),
-            'audio': AudioConfig(),
-            'subtitle': SubtitleConfig(),
-            'ui': UIConfig(),
-            'logging': LoggingConfig()
-        }
-        if section in defaults:
-            setattr(self._config, section, defaults[section])
+        factory = _SECTION_FACTORIES.get(section)
+        if factory:
+            setattr(self._config, section, factory())
             self._dirty = True
             logger.info(f"Config section '{section}' reset to defaults")
     
@@ -278,24 +358,24 @@ class ConfigLoader:
     
     def add_recent_file(self, path: str):
         """Add a file to recent files list."""
-        # Remove if already exists (to move to top)
-        if path in self._config.recent_files:
-            self._config.recent_files.remove(path)
+        recent = self._config.recent_files
         
-        # Add to beginning
-        self._config.recent_files.insert(0, path)
+        # Re-insert so the path becomes the most recent entry
+        recent.pop(path, None)
+        recent[path] = None
         
-        # Trim to max size
-        self._config.recent_files = self._config.recent_files[:self._config.max_recent_files]
+        # Evict oldest entries beyond max size
+        while len(recent) > self._config.max_recent_files:
+            del recent[next(iter(recent))]
         self._dirty = True
     
     def get_recent_files(self) -> list:
-        """Get list of recent files."""
-        return self._config.recent_files.copy()
+        """Get list of recent files (most recent first)."""
+        return list(reversed(self._config.recent_files))
     
     def clear_recent_files(self):
         """Clear recent files list."""
-        self._config.recent_files = []
+        self._config.recent_files = {}
         self._dirty = True
     
     # ==========================================
@@ -312,18 +392,23 @@ class ConfigLoader:
 # ==========================================
 
 _config_instance: Optional[ConfigLoader] = None
+_config_init_lock = threading.Lock()
 
 
 def get_config(config_path: Optional[str] = None) -> ConfigLoader:
     """
     Get the global config loader instance.
     
+    The file is read once per process; later calls return the same loader.
+    
     Args:
         config_path: Optional path to config file (only used on first call)
     """
     global _config_instance
     if _config_instance is None:
-        _config_instance = ConfigLoader(config_path)
+        with _config_init_lock:
+            if _config_instance is None:
+                _config_instance = ConfigLoader(config_path)
     return _config_instance
 
 
@@ -1,5 +1,9 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -9,41 +13,42 @@ class AniVishLogger:
     """
     Centralized logger for AniVish application.
     Supports console and file logging with configurable levels.
+    Use the module-level functions, which share one lazily created instance.
     """
     
-    _instance: Optional['AniVishLogger'] = None
-    _initialized: bool = False
-    
     # Log format templates
     CONSOLE_FORMAT = "%(levelname)s | %(name)s | %(message)s"
     FILE_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
     DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
     
-    def __new__(cls):
-        """Singleton pattern - ensure only one logger instance exists."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # Formatters are stateless, so handlers share one instance each
+    _CONSOLE_FORMATTER = logging.Formatter(CONSOLE_FORMAT)
+    _FILE_FORMATTER = logging.Formatter(FILE_FORMAT, DATE_FORMAT)
+    
+    # Level name -> logging level
+    _LEVEL_MAP = {
+        'DEBUG': logging.DEBUG,
+        'INFO': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR,
+        'CRITICAL': logging.CRITICAL
+    }
     
     def __init__(self):
-        if AniVishLogger._initialized:
-            return
-        
         self._loggers: dict = {}
         self._log_level = logging.INFO
         self._console_handler: Optional[logging.Handler] = None
         self._file_handler: Optional[logging.Handler] = None
+        self._file_listener: Optional[logging.handlers.QueueListener] = None
         self._log_file_path: Optional[Path] = None
         
         # Setup root logger for AniVish
         self._root_logger = logging.getLogger("anivish")
-        self._root_logger.setLevel(logging.DEBUG)
         self._root_logger.propagate = False
         
         # Default: console logging only
         self._setup_console_handler()
-        
-        AniVishLogger._initialized = True
+        self._sync_root_level()
     
     def _setup_console_handler(self):
         """Setup console output handler."""
@@ -52,15 +57,17 @@ class AniVishLogger:
         
         self._console_handler = logging.StreamHandler(sys.stdout)
         self._console_handler.setLevel(self._log_level)
-        self._console_handler.setFormatter(
-            logging.Formatter(self.CONSOLE_FORMAT)
-        )
+        self._console_handler.setFormatter(self._CONSOLE_FORMATTER)
         self._root_logger.addHandler(self._console_handler)
     
     def _setup_file_handler(self, log_dir: Path):
-        """Setup file output handler."""
-        if self._file_handler:
-            self._root_logger.removeHandler(self._file_handler)
+        """
+        Setup file output handler.
+        
+        Records are queued and written by a background listener thread,
+        so logging calls never block on disk I/O.
+        """
+        self._remove_file_handler()
         
         # Create log directory if needed
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -69,16 +76,40 @@ class AniVishLogger:
         timestamp = datetime.now().strftime("%Y%m%d")
         self._log_file_path = log_dir / f"anivish_{timestamp}.log"
         
-        self._file_handler = logging.FileHandler(
+        file_handler = logging.FileHandler(
             self._log_file_path,
             encoding='utf-8'
         )
-        self._file_handler.setLevel(logging.DEBUG)
-        self._file_handler.setFormatter(
-            logging.Formatter(self.FILE_FORMAT, self.DATE_FORMAT)
-        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(self._FILE_FORMATTER)
+        
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._file_handler = logging.handlers.QueueHandler(log_queue)
+        self._file_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._file_listener.start()
         self._root_logger.addHandler(self._file_handler)
     
+    def _remove_file_handler(self):
+        """Detach file handler, flushing queued records to disk."""
+        if self._file_handler:
+            self._root_logger.removeHandler(self._file_handler)
+            self._file_handler = None
+        if self._file_listener:
+            self._file_listener.stop()
+            for handler in self._file_listener.handlers:
+                handler.close()
+            self._file_listener = None
+    
+    def _sync_root_level(self):
+        """
+        Set the root logger to the lowest level any handler accepts, so
+        records no handler wants are rejected before they are created.
+        """
+        level = self._log_level
+        if self._file_handler:
+            level = min(level, logging.DEBUG)  # File log captures everything
+        self._root_logger.setLevel(level)
+    
     def configure(
         self,
         level: str = "INFO",
@@ -96,14 +127,7 @@ class AniVishLogger:
             console_output: Enable console output
         """
         # Set level
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        self._log_level = level_map.get(level.upper(), logging.INFO)
+        self._log_level = self._LEVEL_MAP.get(level.upper(), logging.INFO)
         
         # Update console handler
         if console_output:
@@ -118,9 +142,10 @@ class AniVishLogger:
         if log_to_file:
             log_path = Path(log_dir) if log_dir else Path("./logs")
             self._setup_file_handler(log_path)
-        elif self._file_handler:
-            self._root_logger.removeHandler(self._file_handler)
-            self._file_handler = None
+        else:
+            self._remove_file_handler()
+        
+        self._sync_root_level()
     
     def get_logger(self, name: str) -> logging.Logger:
         """
@@ -132,32 +157,40 @@ class AniVishLogger:
         Returns:
             Logger instance for the component
         """
-        full_name = f"anivish.{name}"
-        if full_name not in self._loggers:
-            logger = logging.getLogger(full_name)
-            self._loggers[full_name] = logger
-        return self._loggers[full_name]
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers.setdefault(name, logging.getLogger(f"anivish.{name}"))
+        return logger
     
     def get_log_file_path(self) -> Optional[Path]:
         """Get current log file path if file logging is enabled."""
         return self._log_file_path
     
+    def shutdown(self):
+        """Flush and stop background file logging."""
+        self._remove_file_handler()
+    
     def set_level(self, level: str):
         """Change log level at runtime."""
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        self._log_level = level_map.get(level.upper(), logging.INFO)
+        self._log_level = self._LEVEL_MAP.get(level.upper(), logging.INFO)
         if self._console_handler:
             self._console_handler.setLevel(self._log_level)
+        self._sync_root_level()
 
 
-# Global singleton instance
+# Global singleton instance (created lazily by _get_instance)
 _logger_instance: Optional[AniVishLogger] = None
+_init_lock = threading.Lock()
+
+
+def _get_instance() -> AniVishLogger:
+    """Get the global AniVishLogger, creating it on first use."""
+    global _logger_instance
+    if _logger_instance is None:
+        with _init_lock:
+            if _logger_instance is None:
+                _logger_instance = AniVishLogger()
+    return _logger_instance
 
 
 def get_logger(name: str = "core") -> logging.Logger:
@@ -170,10 +203,7 @@ def get_logger(name: str = "core") -> logging.Logger:
     Returns:
         Logger instance
     """
-    global _logger_instance
-    if _logger_instance is None:
-        _logger_instance = AniVishLogger()
-    return _logger_instance.get_logger(name)
+    return _get_instance().get_logger(name)
 
 
 def configure_logging(
@@ -191,15 +221,16 @@ def configure_logging(
         log_dir: Directory for log files
         console_output: Enable console output
     """
-    global _logger_instance
-    if _logger_instance is None:
-        _logger_instance = AniVishLogger()
-    _logger_instance.configure(level, log_to_file, log_dir, console_output)
+    _get_instance().configure(level, log_to_file, log_dir, console_output)
 
 
 def set_log_level(level: str):
     """Change log level at runtime."""
-    global _logger_instance
-    if _logger_instance is None:
-        _logger_instance = AniVishLogger()
-    _logger_instance.set_level(level)
\ No newline at end of file
+    _get_instance().set_level(level)
+
+
+@atexit.register
+def _shutdown_logging():
+    """Flush queued file log records on interpreter exit."""
+    if _logger_instance is not None:
+        _logger_instance.shutdown()
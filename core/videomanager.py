@@ -1,7 +1,15 @@
+import asyncio
 import os
+import re
+import stat
+import sys
+import threading
+import time
 import vlc
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import Optional, List, Tuple, Callable, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, NamedTuple, Tuple, Callable, Dict, Any
 from urllib.parse import urlparse
 
 from core.anivish_backend import AniVishBackend
@@ -11,6 +19,32 @@ from core.config_loader import get_config, ConfigLoader
 # Module logger
 logger = get_logger("videomanager")
 
+# A source is parsed by type detection and again by validation; parse it once
+_parse_url = lru_cache(maxsize=256)(urlparse)
+
+# "scheme://" prefix; sources without it are treated as local paths
+_SCHEME_RE = re.compile(r'^[a-z][a-z0-9+.\-]*://', re.IGNORECASE)
+
+# URL schemes VLC can stream from, and those accepted by validation
+# (urlparse lowercases the scheme, so plain membership tests suffice)
+_STREAMING_SCHEMES = frozenset({'http', 'https', 'rtsp', 'rtmp', 'mms'})
+_URL_SCHEMES = _STREAMING_SCHEMES | {'file'}
+
+# Platform used by set_video_output(platform='auto'), resolved once at import
+if sys.platform == 'win32':
+    _HOST_PLATFORM = 'windows'
+elif sys.platform == 'darwin':
+    _HOST_PLATFORM = 'macos'
+else:
+    _HOST_PLATFORM = 'linux'
+
+# Platform -> AniVishBackend method that embeds video in a native window
+_VIDEO_OUTPUT_SETTERS = {
+    'windows': 'set_hwnd',
+    'linux': 'set_xwindow',
+    'macos': 'set_nsobject',
+}
+
 
 class PlaybackState(Enum):
     """Enumeration of possible playback states."""
@@ -33,6 +67,16 @@ class MediaType(Enum):
     UNKNOWN = auto()
 
 
+class StatusSnapshot(NamedTuple):
+    """Playback status read in one call (see VideoManager.get_status_snapshot)."""
+    state: PlaybackState
+    time: int       # ms
+    total: int      # ms
+    volume: int
+    speed: float
+    muted: bool
+
+
 class VideoManagerError(Exception):
     """Base exception for VideoManager errors."""
     pass
@@ -53,13 +97,81 @@ class VideoManager:
     Central API for AniVish video playback management.
     Wraps AniVishBackend and provides high-level media handling,
     event management, subtitle support, and error handling.
+    
+    Call release() when done, or use the manager as a context manager:
+    
+        with VideoManager() as vm:
+            vm.load("movie.mkv")
+    
+    Releasing is mandatory: the VLC event handlers are bound methods held
+    by the player's event manager, which python-vlc keeps for the life of
+    the process. release() detaches them; until then the manager (and its
+    player) is never garbage collected.
     """
 
     # Supported file extensions
-    SUPPORTED_VIDEO_EXT = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mpeg', '.mpg', '.3gp'}
-    SUPPORTED_AUDIO_EXT = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'}
-    SUPPORTED_SUBTITLE_EXT = {'.srt', '.ass', '.ssa', '.sub', '.vtt'}
-    SUPPORTED_STREAM_EXT = {'.m3u8', '.m3u', '.mpd'}
+    SUPPORTED_VIDEO_EXT = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.mpeg', '.mpg', '.3gp'})
+    SUPPORTED_AUDIO_EXT = frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'})
+    SUPPORTED_SUBTITLE_EXT = frozenset({'.srt', '.ass', '.ssa', '.sub', '.vtt'})
+    SUPPORTED_STREAM_EXT = frozenset({'.m3u8', '.m3u', '.mpd'})
+    _ALL_SUPPORTED_MEDIA_EXT = SUPPORTED_VIDEO_EXT | SUPPORTED_AUDIO_EXT
+
+    # Tuple forms for str.endswith checks
+    _MEDIA_EXT_TUPLE = tuple(_ALL_SUPPORTED_MEDIA_EXT)
+    _SUBTITLE_EXT_TUPLE = tuple(SUPPORTED_SUBTITLE_EXT)
+    _HLS_EXT_TUPLE = ('.m3u8', '.m3u')
+
+    # Config changes from loads (recent files) are flushed at most this often
+    CONFIG_FLUSH_INTERVAL_S = 5.0
+
+    # Minimum position change (fraction of duration) between on_position_changed events
+    POSITION_EVENT_MIN_DELTA = 0.001
+    # get_position() reuses the last PositionChanged value for this long while playing
+    POSITION_CACHE_NS = 16_000_000
+
+    # Events accepted by on()/off(); callbacks live in self._cb_<event_name>
+    # as immutable tuples, replaced (never mutated) on on()/off() so emitting
+    # is a plain attribute read and safe against re-registration
+    EVENT_NAMES = (
+        'on_playing',
+        'on_paused',
+        'on_stopped',
+        'on_ended',
+        'on_error',
+        'on_time_changed',
+        'on_position_changed',
+        'on_buffering',
+        'on_state_changed',
+        'on_video_size_changed',
+        'on_media_loaded',
+    )
+
+    # Registered callbacks per event. The class-level empty tuples are shared
+    # by every instance until on() gives the instance its own tuple.
+    _cb_on_playing: Tuple[Callable, ...] = ()
+    _cb_on_paused: Tuple[Callable, ...] = ()
+    _cb_on_stopped: Tuple[Callable, ...] = ()
+    _cb_on_ended: Tuple[Callable, ...] = ()
+    _cb_on_error: Tuple[Callable, ...] = ()
+    _cb_on_time_changed: Tuple[Callable, ...] = ()
+    _cb_on_position_changed: Tuple[Callable, ...] = ()
+    _cb_on_buffering: Tuple[Callable, ...] = ()
+    _cb_on_state_changed: Tuple[Callable, ...] = ()
+    _cb_on_video_size_changed: Tuple[Callable, ...] = ()
+    _cb_on_media_loaded: Tuple[Callable, ...] = ()
+
+    # VLC player events and the method handling each (see _setup_vlc_events)
+    _VLC_EVENT_HANDLERS = (
+        (vlc.EventType.MediaPlayerPlaying, '_on_vlc_playing'),
+        (vlc.EventType.MediaPlayerPaused, '_on_vlc_paused'),
+        (vlc.EventType.MediaPlayerStopped, '_on_vlc_stopped'),
+        (vlc.EventType.MediaPlayerEndReached, '_on_vlc_ended'),
+        (vlc.EventType.MediaPlayerEncounteredError, '_on_vlc_error'),
+        (vlc.EventType.MediaPlayerTimeChanged, '_on_vlc_time_changed'),
+        (vlc.EventType.MediaPlayerPositionChanged, '_on_vlc_position_changed'),
+        (vlc.EventType.MediaPlayerBuffering, '_on_vlc_buffering'),
+        (vlc.EventType.MediaPlayerVout, '_on_vlc_vout'),
+    )
 
     def __init__(self, config_loader: Optional[ConfigLoader] = None):
         """
@@ -70,8 +182,11 @@ class VideoManager:
         """
         logger.info("Initializing VideoManager")
         
-        # Initialize backend
-        self._backend = AniVishBackend()
+        # Backend (libVLC) is created on first use - see _backend
+        self._backend_instance: Optional[AniVishBackend] = None
+        self._backend_init_lock = threading.Lock()
+        # Player event manager our handlers are attached to (see release())
+        self._vlc_event_manager = None
         
         # Load configuration
         self._config = config_loader or get_config()
@@ -81,51 +196,72 @@ class VideoManager:
         self._current_source: Optional[str] = None
         self._media_type: MediaType = MediaType.UNKNOWN
         self._last_error: Optional[str] = None
+        # State to return to once buffering completes
+        self._state_before_buffering: PlaybackState = PlaybackState.IDLE
         
         # Video info cache
         self._video_width: int = 0
         self._video_height: int = 0
         
-        # Event callbacks
-        self._callbacks: Dict[str, List[Callable]] = {
-            'on_playing': [],
-            'on_paused': [],
-            'on_stopped': [],
-            'on_ended': [],
-            'on_error': [],
-            'on_time_changed': [],
-            'on_position_changed': [],
-            'on_buffering': [],
-            'on_state_changed': [],
-            'on_video_size_changed': [],
-            'on_media_loaded': [],
-        }
-        
-        # Setup VLC event handlers
-        self._setup_vlc_events()
-        
-        # Apply initial settings from config
-        self._apply_config_settings()
+        # Last values sent to on_time_changed / on_position_changed (for throttling)
+        self._last_emitted_time_ms: int = -1
+        self._last_emitted_position: float = -1.0
+        self._time_event_min_interval_ms: int = self._config.playback.time_event_min_interval_ms
+        
+        # Latest position pushed by VLC and when it arrived (monotonic ns)
+        self._position_cache: float = -1.0
+        self._position_cache_ns: int = 0
+        
+        # validate_source() results keyed by (source, (mtime_ns, ctime_ns))
+        self._validate_source_cached = lru_cache(maxsize=256)(self._validate_source_uncached)
+        
+        # Pending batched config flush (see _queue_config_save)
+        self._config_flush_timer: Optional[threading.Timer] = None
+        
+        # Per-event emitters: self._emit_<event_name>(*args)
+        for event_name in self.EVENT_NAMES:
+            setattr(self, '_emit_' + event_name, self._make_emitter(event_name))
+        
+        # Worker threads for load_async / subtitle loading (blocking I/O)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='videomgr-io')
         
         logger.info("VideoManager initialized successfully")
 
-    def _apply_config_settings(self):
+    @property
+    def _backend(self) -> AniVishBackend:
+        """Playback backend, created (with events and config applied) on first access."""
+        if self._backend_instance is None:
+            with self._backend_init_lock:
+                if self._backend_instance is None:
+                    backend = AniVishBackend()
+                    
+                    # Setup VLC event handlers
+                    self._setup_vlc_events(backend)
+                    
+                    # Apply initial settings from config
+                    self._apply_config_settings(backend)
+                    
+                    # Publish only once fully set up
+                    self._backend_instance = backend
+        return self._backend_instance
+
+    def _apply_config_settings(self, backend: AniVishBackend):
         """Apply initial settings from configuration."""
         try:
             # Apply default volume
             default_vol = self._config.playback.default_volume
-            self._backend.set_volume(default_vol)
+            backend.set_volume(default_vol)
             logger.debug(f"Applied default volume: {default_vol}")
             
             # Apply default playback speed
             default_speed = self._config.playback.default_speed
-            self._backend.set_playback_speed(default_speed)
+            backend.set_playback_speed(default_speed)
             logger.debug(f"Applied default speed: {default_speed}")
             
             # Apply audio delay if configured
             audio_delay = self._config.audio.audio_delay_ms
             if audio_delay != 0:
-                self._backend.set_audio_delay(audio_delay * 1000)
+                backend.set_audio_delay(audio_delay * 1000)
                 logger.debug(f"Applied audio delay: {audio_delay}ms")
                 
         except Exception as e:
@@ -135,76 +271,114 @@ class VideoManager:
     # Event System
     # ==========================================
 
-    def _setup_vlc_events(self):
-        """Wire up VLC event callbacks."""
-        em = self._backend.get_event_manager()
+    def _setup_vlc_events(self, backend: AniVishBackend):
+        """Wire up VLC event callbacks (bound methods, no wrapper closures)."""
+        # Kept so release() can detach these handlers again (python-vlc memoizes
+        # the wrapper itself for the life of the process)
+        em = self._vlc_event_manager = backend.get_event_manager()
         
-        em.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_vlc_playing)
-        em.event_attach(vlc.EventType.MediaPlayerPaused, self._on_vlc_paused)
-        em.event_attach(vlc.EventType.MediaPlayerStopped, self._on_vlc_stopped)
-        em.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_vlc_ended)
-        em.event_attach(vlc.EventType.MediaPlayerEncounteredError, self._on_vlc_error)
-        em.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_vlc_time_changed)
-        em.event_attach(vlc.EventType.MediaPlayerPositionChanged, self._on_vlc_position_changed)
-        em.event_attach(vlc.EventType.MediaPlayerBuffering, self._on_vlc_buffering)
-        em.event_attach(vlc.EventType.MediaPlayerVout, self._on_vlc_vout)
+        for event_type, handler_name in self._VLC_EVENT_HANDLERS:
+            em.event_attach(event_type, getattr(self, handler_name))
         
         logger.debug("VLC events wired up")
 
-    def _emit(self, event_name: str, *args, **kwargs):
-        """Emit an event to all registered callbacks."""
-        for callback in self._callbacks.get(event_name, []):
-            try:
-                callback(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Callback error for {event_name}: {e}")
+    def _make_emitter(self, event_name: str) -> Callable:
+        """
+        Build the emitter for one event.
+        
+        The emitter reads the event's current callback tuple on every call
+        (so on()/off() take effect immediately) and skips the loop for the
+        common no-subscriber and single-subscriber cases.
+        
+        Args:
+            event_name: Event name from EVENT_NAMES
+            
+        Returns:
+            Callable taking the event's arguments
+        """
+        attr = '_cb_' + event_name
+
+        def emit(*args):
+            callbacks = getattr(self, attr)
+            if not callbacks:
+                return
+            if len(callbacks) == 1:
+                try:
+                    callbacks[0](*args)
+                except Exception as e:
+                    logger.error(f"Callback error for {event_name}: {e}")
+                return
+            for callback in callbacks:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logger.error(f"Callback error for {event_name}: {e}")
+
+        return emit
 
     def _set_state(self, new_state: PlaybackState):
         """Update state and emit state change event."""
         if self._state != new_state:
             old_state = self._state
             self._state = new_state
-            logger.debug(f"State changed: {old_state.name} -> {new_state.name}")
-            self._emit('on_state_changed', old_state, new_state)
+            logger.debug("State changed: %s -> %s", old_state.name, new_state.name)
+            self._emit_on_state_changed(old_state, new_state)
 
     # VLC Event Handlers
     def _on_vlc_playing(self, event):
         self._set_state(PlaybackState.PLAYING)
         self._update_video_size()
-        self._emit('on_playing')
+        self._emit_on_playing()
 
     def _on_vlc_paused(self, event):
         self._set_state(PlaybackState.PAUSED)
-        self._emit('on_paused')
+        self._emit_on_paused()
 
     def _on_vlc_stopped(self, event):
         self._set_state(PlaybackState.STOPPED)
-        self._emit('on_stopped')
+        self._emit_on_stopped()
 
     def _on_vlc_ended(self, event):
         self._set_state(PlaybackState.ENDED)
         logger.info("Playback ended")
-        self._emit('on_ended')
+        self._emit_on_ended()
 
     def _on_vlc_error(self, event):
         self._last_error = "Playback error occurred"
         self._set_state(PlaybackState.ERROR)
         logger.error(f"VLC error: {self._last_error}")
-        self._emit('on_error', self._last_error)
+        self._emit_on_error(self._last_error)
 
+    # Time/position handlers read the value carried by the event itself,
+    # so they never call back into libvlc from its event thread
     def _on_vlc_time_changed(self, event):
-        time_ms = self._backend.get_current_time()
-        self._emit('on_time_changed', time_ms)
+        time_ms = event.u.new_time
+        if abs(time_ms - self._last_emitted_time_ms) < self._time_event_min_interval_ms:
+            return
+        self._last_emitted_time_ms = time_ms
+        self._emit_on_time_changed(time_ms)
 
     def _on_vlc_position_changed(self, event):
-        position = self._backend.get_position()
-        self._emit('on_position_changed', position)
+        position = event.u.new_position
+        self._position_cache = position
+        self._position_cache_ns = time.monotonic_ns()
+        if abs(position - self._last_emitted_position) < self.POSITION_EVENT_MIN_DELTA:
+            return
+        self._last_emitted_position = position
+        self._emit_on_position_changed(position)
 
     def _on_vlc_buffering(self, event):
-        if self._state != PlaybackState.BUFFERING:
-            self._set_state(PlaybackState.BUFFERING)
-            logger.debug("Buffering started")
-        self._emit('on_buffering', event.u.new_cache)
+        cache = event.u.new_cache
+        if cache < 100:
+            if self._state != PlaybackState.BUFFERING:
+                self._state_before_buffering = self._state
+                self._set_state(PlaybackState.BUFFERING)
+                logger.debug("Buffering started")
+        elif self._state == PlaybackState.BUFFERING:
+            # VLC sends no new Playing/Paused event once the buffer refills.
+            # Runs on libVLC's event thread, so restore without querying it.
+            self._set_state(self._state_before_buffering)
+        self._emit_on_buffering(cache)
 
     def _on_vlc_vout(self, event):
         self._update_video_size()
@@ -216,8 +390,8 @@ class VideoManager:
         if w > 0 and h > 0 and (w != self._video_width or h != self._video_height):
             self._video_width = w
             self._video_height = h
-            logger.debug(f"Video size: {w}x{h}")
-            self._emit('on_video_size_changed', w, h)
+            logger.debug("Video size: %dx%d", w, h)
+            self._emit_on_video_size_changed(w, h)
 
     # Public event registration
     def on(self, event_name: str, callback: Callable):
@@ -229,34 +403,54 @@ class VideoManager:
             on_time_changed, on_position_changed, on_buffering,
             on_state_changed, on_video_size_changed, on_media_loaded
         """
-        if event_name in self._callbacks:
-            self._callbacks[event_name].append(callback)
+        if event_name in self.EVENT_NAMES:
+            attr = '_cb_' + event_name
+            setattr(self, attr, getattr(self, attr) + (callback,))
             logger.debug(f"Callback registered for: {event_name}")
         else:
             raise ValueError(f"Unknown event: {event_name}")
 
     def off(self, event_name: str, callback: Callable):
         """Unregister a callback."""
-        if event_name in self._callbacks and callback in self._callbacks[event_name]:
-            self._callbacks[event_name].remove(callback)
+        if event_name not in self.EVENT_NAMES:
+            return
+        attr = '_cb_' + event_name
+        callbacks = list(getattr(self, attr))
+        if callback in callbacks:
+            callbacks.remove(callback)
+            setattr(self, attr, tuple(callbacks))
             logger.debug(f"Callback unregistered for: {event_name}")
 
+    def set_time_update_interval(self, interval_ms: int):
+        """
+        Set the minimum playback-time change between on_time_changed events.
+
+        Args:
+            interval_ms: Interval in milliseconds (0 emits every VLC update)
+        """
+        self._time_event_min_interval_ms = max(0, interval_ms)
+        self._last_emitted_time_ms = -1  # Let the next update through
+
+    def get_time_update_interval(self) -> int:
+        """Get the on_time_changed throttle interval in milliseconds."""
+        return self._time_event_min_interval_ms
+
     # ==========================================
     # Media Loading & Validation
     # ==========================================
 
     def _detect_media_type(self, source: str) -> MediaType:
         """Detect the type of media source."""
-        parsed = urlparse(source)
-        
-        # Check if it's a URL
-        if parsed.scheme in ('http', 'https', 'rtsp', 'rtmp', 'mms'):
-            ext = os.path.splitext(parsed.path)[1].lower()
-            if ext in ('.m3u8', '.m3u'):
-                return MediaType.STREAM_HLS
-            elif ext == '.mpd':
-                return MediaType.STREAM_DASH
-            return MediaType.HTTP_URL
+        # Check if it's a URL (plain paths skip URL parsing entirely)
+        if _SCHEME_RE.match(source):
+            parsed = _parse_url(source)
+            if parsed.scheme in _STREAMING_SCHEMES:
+                url_path = parsed.path.lower()
+                if url_path.endswith(self._HLS_EXT_TUPLE):
+                    return MediaType.STREAM_HLS
+                elif url_path.endswith('.mpd'):
+                    return MediaType.STREAM_DASH
+                return MediaType.HTTP_URL
         
         # Local file
         if os.path.exists(source):
@@ -266,37 +460,36 @@ class VideoManager:
 
     def _validate_local_file(self, path: str) -> Tuple[bool, Optional[str]]:
         """Validate a local file path."""
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return False, f"File not found: {path}"
+        except OSError as e:
+            return False, f"Cannot read file: {e}"
         
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Not a file: {path}"
         
-        ext = os.path.splitext(path)[1].lower()
-        all_supported = self.SUPPORTED_VIDEO_EXT | self.SUPPORTED_AUDIO_EXT
-        
-        if ext and ext not in all_supported:
-            return False, f"Unsupported format: {ext}"
+        # Extension is only split out to report it (files without one are allowed)
+        if not path.lower().endswith(self._MEDIA_EXT_TUPLE):
+            ext = os.path.splitext(path)[1].lower()
+            if ext:
+                return False, f"Unsupported format: {ext}"
         
-        # Check file is readable
-        try:
-            with open(path, 'rb') as f:
-                f.read(1024)
-        except PermissionError:
+        # Check file is readable (actual read errors surface as VLC errors)
+        if not os.access(path, os.R_OK):
             return False, f"Permission denied: {path}"
-        except IOError as e:
-            return False, f"Cannot read file: {e}"
         
         return True, None
 
     def _validate_url(self, url: str) -> Tuple[bool, Optional[str]]:
         """Validate a URL (basic validation without network check)."""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         
         if not parsed.scheme:
             return False, "URL missing scheme (http/https)"
         
-        if parsed.scheme not in ('http', 'https', 'rtsp', 'rtmp', 'mms', 'file'):
+        if parsed.scheme not in _URL_SCHEMES:
             return False, f"Unsupported URL scheme: {parsed.scheme}"
         
         if not parsed.netloc and parsed.scheme != 'file':
@@ -308,11 +501,27 @@ class VideoManager:
         """
         Validate a media source before loading.
         
+        Results are memoized per source and file modification/status-change
+        time, so re-checking a list of sources (e.g. recent files) is cheap
+        and a changed file (including a chmod) is re-validated automatically.
+        
         Returns:
             Tuple of (is_valid, error_message)
         """
-        media_type = self._detect_media_type(source)
-        
+        try:
+            st = os.stat(source)
+            # ctime also moves on permission changes, which mtime misses
+            stamp = (st.st_mtime_ns, st.st_ctime_ns)
+        except (OSError, ValueError):
+            stamp = (0, 0)  # URL or missing file
+        return self._validate_source_cached(source, stamp)
+
+    def _validate_source_uncached(self, source: str, stamp: Tuple[int, int]) -> Tuple[bool, Optional[str]]:
+        """validate_source() body; stamp is only part of the cache key."""
+        return self._validate_source_as(source, self._detect_media_type(source))
+
+    def _validate_source_as(self, source: str, media_type: MediaType) -> Tuple[bool, Optional[str]]:
+        """Validate a media source whose type has already been detected."""
         if media_type == MediaType.LOCAL_FILE:
             return self._validate_local_file(source)
         elif media_type in (MediaType.HTTP_URL, MediaType.STREAM_HLS, MediaType.STREAM_DASH):
@@ -328,7 +537,8 @@ class VideoManager:
         Load a media source (file or URL).
         
         Args:
-            source: File path or URL
+            source: File path or URL, used as given (see clean_source()
+                    for typed or pasted input)
             validate: Whether to validate before loading
             
         Returns:
@@ -338,51 +548,159 @@ class VideoManager:
             InvalidSourceError: If validation fails
             MediaLoadError: If loading fails
         """
-        # Clean up source string
-        source = source.strip().strip('"').strip("'")
         logger.info(f"Loading media: {source}")
         
-        # Validate
-        if validate:
-            is_valid, error = self.validate_source(source)
-            if not is_valid:
-                self._last_error = error
-                self._set_state(PlaybackState.ERROR)
-                logger.error(f"Validation failed: {error}")
-                raise InvalidSourceError(error)
-        
-        # Detect type
-        self._media_type = self._detect_media_type(source)
-        self._set_state(PlaybackState.LOADING)
+        media_type, error = self._check_source(source, validate)
+        self._begin_load(media_type, error)
         
         # Load via backend
         try:
-            if not self._backend.set_media(source):
-                self._last_error = "Failed to load media"
-                self._set_state(PlaybackState.ERROR)
-                logger.error("Backend failed to load media")
-                raise MediaLoadError("Backend failed to load media")
-            
-            self._current_source = source
-            self._last_error = None
-            self._set_state(PlaybackState.STOPPED)
-            
-            # Add to recent files
-            if self._media_type == MediaType.LOCAL_FILE:
-                self._config.add_recent_file(source)
-                self._config.save_if_dirty()
+            return self._complete_load(source, self._backend.set_media(source))
+        except (InvalidSourceError, MediaLoadError):
+            raise
+        except Exception as e:
+            self._fail_load(e)
+
+    async def load_async(self, source: str, validate: bool = True) -> bool:
+        """
+        Load a media source without blocking the calling event loop.
+        
+        Validation (filesystem stats) and the backend load run on a worker
+        thread; state changes and callbacks happen on the loop's thread.
+        
+        Args:
+            source: File path or URL, used as given (see load())
+            validate: Whether to validate before loading
             
-            logger.info(f"Media loaded successfully: {self._media_type.name}")
-            self._emit('on_media_loaded', source, self._media_type)
-            return True
+        Returns:
+            True if loaded successfully
             
+        Raises:
+            InvalidSourceError: If validation fails
+            MediaLoadError: If loading fails
+        """
+        loop = asyncio.get_running_loop()
+        logger.info(f"Loading media: {source}")
+        
+        media_type, error = await loop.run_in_executor(
+            self._executor, self._check_source, source, validate
+        )
+        self._begin_load(media_type, error)
+        
+        try:
+            # Resolve _backend on the worker too: first access creates libVLC
+            loaded = await loop.run_in_executor(
+                self._executor, lambda: self._backend.set_media(source)
+            )
+            return self._complete_load(source, loaded)
         except (InvalidSourceError, MediaLoadError):
             raise
         except Exception as e:
-            self._last_error = str(e)
+            self._fail_load(e)
+
+    def load_many(self, sources: List[str]) -> List[Tuple[str, bool, Optional[str]]]:
+        """
+        Validate a batch of sources in one pass and load the first usable one.
+
+        Sources are checked concurrently on the worker pool (stats are slow
+        on network filesystems). Valid sources are tried in order until one
+        loads; the rest are only validated, for the caller to queue.
+
+        Args:
+            sources: File paths or URLs, in playback order (used as given)
+
+        Returns:
+            List of (source, is_valid, error_message) in input order
+        """
+        logger.info(f"Validating {len(sources)} media sources")
+        checks = self._executor.map(self._check_source, sources, [True] * len(sources))
+
+        results = []
+        loaded = False
+        for source, (media_type, error) in zip(sources, checks):
+            if error is None and not loaded:
+                logger.info(f"Loading media: {source}")
+                try:
+                    self._begin_load(media_type, None)
+                    try:
+                        ok = self._backend.set_media(source)
+                    except Exception as e:
+                        self._fail_load(e)
+                    loaded = self._complete_load(source, ok)
+                except MediaLoadError as e:
+                    error = str(e)
+            results.append((source, error is None, error))
+        return results
+
+    def _check_source(self, source: str, validate: bool) -> Tuple[MediaType, Optional[str]]:
+        """
+        Detect the source type and optionally validate it.
+        Touches no manager state, so it is safe to run on a worker thread.
+        
+        Returns:
+            Tuple of (media_type, error_message or None)
+        """
+        media_type = self._detect_media_type(source)
+        if validate:
+            is_valid, error = self._validate_source_as(source, media_type)
+            if not is_valid:
+                return media_type, error
+        return media_type, None
+
+    def _begin_load(self, media_type: MediaType, error: Optional[str]):
+        """Enter LOADING state, or ERROR (raising) if validation failed."""
+        if error is not None:
+            self._last_error = error
             self._set_state(PlaybackState.ERROR)
-            logger.error(f"Failed to load media: {e}")
-            raise MediaLoadError(f"Failed to load media: {e}")
+            logger.error(f"Validation failed: {error}")
+            raise InvalidSourceError(error)
+        
+        self._media_type = media_type
+        self._set_state(PlaybackState.LOADING)
+
+    def _complete_load(self, source: str, loaded: bool) -> bool:
+        """Finish a load after the backend call; raises MediaLoadError on failure."""
+        if not loaded:
+            self._last_error = "Failed to load media"
+            self._set_state(PlaybackState.ERROR)
+            logger.error("Backend failed to load media")
+            raise MediaLoadError("Backend failed to load media")
+        
+        self._current_source = source
+        self._last_error = None
+        self._last_emitted_time_ms = -1
+        self._last_emitted_position = -1.0
+        self._set_state(PlaybackState.STOPPED)
+        
+        # Add to recent files
+        if self._media_type == MediaType.LOCAL_FILE:
+            self._config.add_recent_file(source)
+            self._queue_config_save()
+        
+        logger.info(f"Media loaded successfully: {self._media_type.name}")
+        self._emit_on_media_loaded(source, self._media_type)
+        return True
+
+    def _queue_config_save(self):
+        """Flush config to disk within CONFIG_FLUSH_INTERVAL_S, batching repeated calls."""
+        if self._config_flush_timer is None:
+            self._config_flush_timer = threading.Timer(
+                self.CONFIG_FLUSH_INTERVAL_S, self._flush_config
+            )
+            self._config_flush_timer.daemon = True
+            self._config_flush_timer.start()
+
+    def _flush_config(self):
+        """Timer callback: write pending config changes."""
+        self._config_flush_timer = None
+        self._config.save_if_dirty()
+
+    def _fail_load(self, e: Exception):
+        """Record an unexpected load failure and raise it as MediaLoadError."""
+        self._last_error = str(e)
+        self._set_state(PlaybackState.ERROR)
+        logger.error(f"Failed to load media: {e}")
+        raise MediaLoadError(f"Failed to load media: {e}")
 
     def load_url(self, url: str) -> bool:
         """Load media from URL."""
@@ -420,18 +738,29 @@ class VideoManager:
             self.play()
 
     def seek(self, position_ms: int):
-        """Seek to position in milliseconds."""
+        """Seek to position in milliseconds (coalesced with rapid follow-up seeks)."""
         self._backend.seek(position_ms)
-        logger.debug(f"Seek to: {position_ms}ms")
+        logger.debug("Seek to: %sms", position_ms)
 
-    def seek_relative(self, offset_ms: int):
-        """Seek relative to current position."""
-        self._backend.seek_relative(offset_ms)
+    def seek_immediate(self, position_ms: int):
+        """Seek to position in milliseconds right away, without coalescing."""
+        self._backend.seek_immediate(position_ms)
+        self._position_cache_ns = 0
+        logger.debug("Seek to: %sms", position_ms)
+
+    def seek_relative(self, offset_ms: int, precise: bool = False):
+        """Seek relative to current position (keyframe-accurate unless precise)."""
+        self._backend.seek_relative(offset_ms, precise)
 
     def seek_percent(self, percent: float):
         """Seek to percentage of total duration (0-100)."""
         self._backend.set_position(percent / 100.0)
 
+    def seek_percent_immediate(self, percent: float):
+        """Seek to percentage of total duration (0-100) right away, without coalescing."""
+        self._backend.set_position_immediate(percent / 100.0)
+        self._position_cache_ns = 0
+
     def skip_forward(self):
         """Skip forward by configured short interval."""
         interval = self._config.playback.skip_interval_short
@@ -462,12 +791,17 @@ class VideoManager:
 
     def get_position(self) -> float:
         """Get position as fraction (0.0 to 1.0)."""
+        # Reads right after a PositionChanged event (e.g. several UI widgets
+        # updating from one callback) reuse the pushed value
+        if (self._state == PlaybackState.PLAYING
+                and time.monotonic_ns() - self._position_cache_ns < self.POSITION_CACHE_NS):
+            return self._position_cache
         return self._backend.get_position()
 
     def set_playback_speed(self, rate: float):
         """Set playback speed (0.25 to 4.0)."""
         self._backend.set_playback_speed(rate)
-        logger.debug(f"Playback speed: {rate}x")
+        logger.debug("Playback speed: %sx", rate)
 
     def get_playback_speed(self) -> float:
         """Get current playback speed."""
@@ -481,6 +815,26 @@ class VideoManager:
         """Get current playback state."""
         return self._state
 
+    def get_status_snapshot(self) -> StatusSnapshot:
+        """
+        Get state, time, duration, volume, speed and mute in one call.
+        
+        Time and duration come from the backend's event caches; only
+        volume, speed and mute query libvlc.
+        
+        Returns:
+            StatusSnapshot of the current playback status
+        """
+        backend = self._backend
+        return StatusSnapshot(
+            self._state,
+            backend.get_current_time(),
+            backend.get_total_duration(),
+            backend.get_volume(),
+            backend.get_playback_speed(),
+            backend.is_muted(),
+        )
+
     # ==========================================
     # Audio Subsystem
     # ==========================================
@@ -573,13 +927,13 @@ class VideoManager:
             logger.error(f"Subtitle file not found: {path}")
             return False
         
-        ext = os.path.splitext(path)[1].lower()
-        if ext not in self.SUPPORTED_SUBTITLE_EXT:
+        if not path.lower().endswith(self._SUBTITLE_EXT_TUPLE):
+            ext = os.path.splitext(path)[1].lower()
             logger.error(f"Unsupported subtitle format: {ext}")
             return False
         
         # VLC expects absolute path
-        abs_path = os.path.abspath(path)
+        abs_path = path if os.path.isabs(path) else os.path.abspath(path)
         result = self._backend.load_subtitle_file(abs_path)
         
         if result:
@@ -604,6 +958,16 @@ class VideoManager:
             logger.info(f"Subtitle loaded from URL: {url}")
         return result
 
+    async def load_subtitle_file_async(self, path: str) -> bool:
+        """Like load_subtitle_file(), but runs on a worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.load_subtitle_file, path)
+
+    async def load_subtitle_url_async(self, url: str) -> bool:
+        """Like load_subtitle_url(), but runs on a worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.load_subtitle_url, url)
+
     def set_subtitle_delay(self, delay_ms: int):
         """
         Set subtitle delay in milliseconds.
@@ -661,20 +1025,11 @@ class VideoManager:
             platform: 'windows', 'linux', 'macos', or 'auto'
         """
         if platform == 'auto':
-            import sys
-            if sys.platform == 'win32':
-                platform = 'windows'
-            elif sys.platform == 'darwin':
-                platform = 'macos'
-            else:
-                platform = 'linux'
-        
-        if platform == 'windows':
-            self._backend.set_hwnd(handle)
-        elif platform == 'linux':
-            self._backend.set_xwindow(handle)
-        elif platform == 'macos':
-            self._backend.set_nsobject(handle)
+            platform = _HOST_PLATFORM
+        
+        setter = _VIDEO_OUTPUT_SETTERS.get(platform)
+        if setter is not None:
+            getattr(self._backend, setter)(handle)
         
         logger.debug(f"Video output set for platform: {platform}")
 
@@ -715,17 +1070,35 @@ class VideoManager:
     def release(self):
         """Release all resources."""
         logger.info("Releasing VideoManager resources")
-        self.stop()
+        self._executor.shutdown(wait=False)
+        self._validate_source_cached.cache_clear()
+        # Stop playback first so it ends without waiting on the config write
+        if self._backend_instance is not None:
+            self.stop()
+            self._detach_vlc_events()
+            self._backend_instance.release()
+            self._backend_instance = None
+        if self._config_flush_timer is not None:
+            self._config_flush_timer.cancel()
+            self._config_flush_timer = None
         self._config.save_if_dirty()
-        self._backend.release()
         self._current_source = None
         self._set_state(PlaybackState.IDLE)
 
-    def __del__(self):
-        try:
-            self.release()
-        except Exception:
-            pass
+    def _detach_vlc_events(self):
+        """Detach the _on_vlc_* handlers so the shared event manager stops pinning us."""
+        em = self._vlc_event_manager
+        if em is None:
+            return
+        for event_type, _ in self._VLC_EVENT_HANDLERS:
+            em.event_detach(event_type)
+        self._vlc_event_manager = None
+
+    def __enter__(self) -> 'VideoManager':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
 
 
 # ==========================================
@@ -742,4 +1115,20 @@ def create_video_manager(config_path: Optional[str] = None) -> VideoManager:
     if config_path:
         config = get_config(config_path)
         return VideoManager(config)
-    return VideoManager()
\ No newline at end of file
+    return VideoManager()
+
+
+def clean_source(source: str) -> str:
+    """
+    Normalize a typed or pasted path/URL for load().
+    
+    Strips whitespace and one pair of matching surrounding quotes. Apply it
+    once: a second pass would also strip quotes that belong to the name.
+    
+    Args:
+        source: Raw user input
+    """
+    source = source.strip()
+    if len(source) >= 2 and source[0] == source[-1] and source[0] in ('"', "'"):
+        return source[1:-1]
+    return source
\ No newline at end of file
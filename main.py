@@ -1,65 +1,24 @@
+from __future__ import annotations
+
+import logging
+import queue
 import sys
 import os
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-# Initialize logging first
 from core.logger import configure_logging, get_logger
-configure_logging(level="DEBUG", log_to_file=True, console_output=True)
 logger = get_logger("main")
 
-from core.videomanager import VideoManager, PlaybackState, MediaType
-from core.config_loader import get_config
-
-
-def format_time(ms: int) -> str:
-    """Convert milliseconds to HH:MM:SS format."""
-    if ms < 0:
-        return "--:--:--"
-    seconds = ms // 1000
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-
-
-def print_status(vm: VideoManager):
-    """Print current playback status."""
-    state = vm.get_state().name
-    current = vm.get_current_time()
-    total = vm.get_total_duration()
-    volume = vm.get_volume()
-    speed = vm.get_playback_speed()
-    muted = vm.is_muted()
-    
-    mute_str = " [MUTED]" if muted else ""
-    print(f"  State: {state} | Time: {format_time(current)} / {format_time(total)} | "
-          f"Vol: {volume}%{mute_str} | Speed: {speed:.2f}x")
-
-
-def print_media_info(vm: VideoManager):
-    """Print comprehensive media information."""
-    info = vm.get_media_info()
-    if info:
-        print("\n  === Media Info ===")
-        print(f"  Source: {info.get('source', 'Unknown')}")
-        print(f"  Type: {info.get('media_type', 'Unknown')}")
-        print(f"  Duration: {format_time(info.get('duration_ms', -1))}")
-        print(f"  Resolution: {info.get('video_width', 0)}x{info.get('video_height', 0)}")
-        
-        # Audio tracks
-        audio_tracks = vm.get_audio_tracks()
-        current_audio = vm.get_current_audio_track()
-        print(f"  Audio Tracks: {len(audio_tracks)} (current: {current_audio})")
-        
-        # Subtitle tracks
-        sub_tracks = vm.get_subtitle_tracks()
-        current_sub = vm.get_current_subtitle_track()
-        print(f"  Subtitle Tracks: {len(sub_tracks)} (current: {current_sub})")
-        print()
+# VideoManager pulls in python-vlc and loads libVLC; main() imports it
+# once logging is configured, so `--help` never pays for it
+if TYPE_CHECKING:
+    from core.videomanager import VideoManager, clean_source
 
 
-def print_help():
-    """Print available commands."""
-    print("""
+# Printed by print_help (ends with a blank line, like print() of the block did)
+_HELP_TEXT = """
 ================================================================================
                             AniVish CLI Test Harness
 ================================================================================
@@ -107,281 +66,420 @@ def print_help():
     q           Quit
 
 ================================================================================
-""")
+
+"""
+
+
+# "00".."99", so formatting is indexing plus concatenation
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS (cached: playback repeats each second)."""
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours >= 100:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return _TWO_DIGITS[hours] + ":" + _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[secs]
+
+
+def format_time(ms: int) -> str:
+    """Convert milliseconds to HH:MM:SS format."""
+    if ms < 0:
+        return "--:--:--"
+    return _format_seconds(ms // 1000)
+
+
+def print_status(vm: VideoManager):
+    """Print current playback status."""
+    s = vm.get_status_snapshot()
+    mute_str = " [MUTED]" if s.muted else ""
+    print(f"  State: {s.state.name} | Time: {format_time(s.time)} / {format_time(s.total)} | "
+          f"Vol: {s.volume}%{mute_str} | Speed: {s.speed:.2f}x")
+
+
+def print_media_info(vm: VideoManager):
+    """Print comprehensive media information."""
+    info = vm.get_media_info()
+    if info:
+        # Audio tracks
+        audio_tracks = vm.get_audio_tracks()
+        current_audio = vm.get_current_audio_track()
+        
+        # Subtitle tracks
+        sub_tracks = vm.get_subtitle_tracks()
+        current_sub = vm.get_current_subtitle_track()
+        
+        lines = [
+            "\n  === Media Info ===",
+            f"  Source: {info.get('source', 'Unknown')}",
+            f"  Type: {info.get('media_type', 'Unknown')}",
+            f"  Duration: {format_time(info.get('duration_ms', -1))}",
+            f"  Resolution: {info.get('video_width', 0)}x{info.get('video_height', 0)}",
+            f"  Audio Tracks: {len(audio_tracks)} (current: {current_audio})",
+            f"  Subtitle Tracks: {len(sub_tracks)} (current: {current_sub})",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_help():
+    """Print available commands."""
+    sys.stdout.write(_HELP_TEXT)
 
 
 def print_config(vm: VideoManager):
     """Print current configuration values."""
     cfg = vm.get_config()
-    print("\n  === Current Configuration ===")
-    print(f"  Config file: {cfg.get_config_path()}")
-    print("\n  [Playback]")
-    print(f"    Default Volume: {cfg.playback.default_volume}")
-    print(f"    Default Speed: {cfg.playback.default_speed}")
-    print(f"    Skip Short: {cfg.playback.skip_interval_short}ms")
-    print(f"    Skip Long: {cfg.playback.skip_interval_long}ms")
-    print(f"    Resume Playback: {cfg.playback.resume_playback}")
-    print("\n  [Audio]")
-    print(f"    Audio Delay: {cfg.audio.audio_delay_ms}ms")
-    print("\n  [Subtitle]")
-    print(f"    Enabled: {cfg.subtitle.enabled}")
-    print(f"    Delay: {cfg.subtitle.subtitle_delay_ms}ms")
-    print("\n  [Logging]")
-    print(f"    Level: {cfg.logging.level}")
-    print(f"    Log to File: {cfg.logging.log_to_file}")
-    print()
+    lines = [
+        "\n  === Current Configuration ===",
+        f"  Config file: {cfg.get_config_path()}",
+        "\n  [Playback]",
+        f"    Default Volume: {cfg.playback.default_volume}",
+        f"    Default Speed: {cfg.playback.default_speed}",
+        f"    Skip Short: {cfg.playback.skip_interval_short}ms",
+        f"    Skip Long: {cfg.playback.skip_interval_long}ms",
+        f"    Resume Playback: {cfg.playback.resume_playback}",
+        "\n  [Audio]",
+        f"    Audio Delay: {cfg.audio.audio_delay_ms}ms",
+        "\n  [Subtitle]",
+        f"    Enabled: {cfg.subtitle.enabled}",
+        f"    Delay: {cfg.subtitle.subtitle_delay_ms}ms",
+        "\n  [Logging]",
+        f"    Level: {cfg.logging.level}",
+        f"    Log to File: {cfg.logging.log_to_file}",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_recent_files(vm: VideoManager):
     """Print recent files list."""
     recent = vm.get_recent_files()
-    print("\n  === Recent Files ===")
+    lines = ["\n  === Recent Files ==="]
     if recent:
-        for i, path in enumerate(recent, 1):
-            print(f"  {i}. {path}")
+        lines.extend(f"  {i}. {path}" for i, path in enumerate(recent, 1))
     else:
-        print("  (no recent files)")
-    print()
+        lines.append("  (no recent files)")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def handle_command(vm: VideoManager, command: str) -> bool:
-    """
-    Handle a command. Returns False if should quit.
-    """
-    parts = command.split(maxsplit=1)
-    cmd = parts[0]
-    arg = parts[1] if len(parts) > 1 else None
-    
-    # ==================== PLAYBACK ====================
-    if cmd == "p":
-        # FIX: Use is_playing() which directly queries VLC state
-        # instead of get_state() which relies on async event updates
-        if vm.is_playing():
-            vm.pause()
-            print("Paused")
-        else:
-            vm.play()
-            print("Playing")
-    
-    elif cmd == "s":
-        vm.stop()
-        print("Stopped")
-    
-    elif cmd == "<":
-        vm.skip_backward()
-        print(f"Seek -10s")
-        print_status(vm)
-    
-    elif cmd == ">":
-        vm.skip_forward()
-        print(f"Seek +10s")
-        print_status(vm)
-    
-    elif cmd == "<<":
-        vm.skip_backward_long()
-        print(f"Seek -60s")
+def _print_tracks(title: str, tracks, current: int, footer: Optional[str] = None):
+    """Print a track list, marking the current track, in one write."""
+    lines = [f"\n  {title}:"]
+    if tracks:
+        for tid, tname in tracks:
+            marker = " <-- current" if tid == current else ""
+            lines.append(f"    [{tid}] {tname}{marker}")
+    else:
+        lines.append("    (none available)")
+    if footer is not None:
+        lines.append(footer)
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# ==========================================
+# Command Handlers
+# ==========================================
+# Handlers in _COMMANDS take (vm); those in _ARG_COMMANDS take (vm, arg)
+# and are only used when the command has an argument.
+
+# ==================== PLAYBACK ====================
+
+def _cmd_toggle_play(vm: VideoManager):
+    # FIX: Use is_playing() which directly queries VLC state
+    # instead of get_state() which relies on async event updates
+    if vm.is_playing():
+        vm.pause()
+        print("Paused")
+    else:
+        vm.play()
+        print("Playing")
+
+
+def _cmd_stop(vm: VideoManager):
+    vm.stop()
+    print("Stopped")
+
+
+def _cmd_skip_back(vm: VideoManager):
+    vm.skip_backward()
+    print(f"Seek -10s")
+    print_status(vm)
+
+
+def _cmd_skip_forward(vm: VideoManager):
+    vm.skip_forward()
+    print(f"Seek +10s")
+    print_status(vm)
+
+
+def _cmd_skip_back_long(vm: VideoManager):
+    vm.skip_backward_long()
+    print(f"Seek -60s")
+    print_status(vm)
+
+
+def _cmd_skip_forward_long(vm: VideoManager):
+    vm.skip_forward_long()
+    print(f"Seek +60s")
+    print_status(vm)
+
+
+def _cmd_goto(vm: VideoManager, arg: str):
+    try:
+        pos_ms = int(arg)
+        vm.seek_immediate(pos_ms)
+        print(f"Seek to {format_time(pos_ms)}")
         print_status(vm)
-    
-    elif cmd == ">>":
-        vm.skip_forward_long()
-        print(f"Seek +60s")
+    except ValueError:
+        print("Usage: g <milliseconds>")
+
+
+def _cmd_goto_percent(vm: VideoManager, arg: str):
+    try:
+        percent = float(arg)
+        vm.seek_percent_immediate(percent)
+        print(f"Seek to {percent:.1f}%")
         print_status(vm)
-    
-    elif cmd == "g" and arg:
-        try:
-            pos_ms = int(arg)
-            vm.seek(pos_ms)
-            print(f"Seek to {format_time(pos_ms)}")
-            print_status(vm)
-        except ValueError:
-            print("Usage: g <milliseconds>")
-    
-    elif cmd == "g%" and arg:
-        try:
-            percent = float(arg)
-            vm.seek_percent(percent)
-            print(f"Seek to {percent:.1f}%")
-            print_status(vm)
-        except ValueError:
-            print("Usage: g% <0-100>")
-    
-    # ==================== AUDIO ====================
-    elif cmd == "+":
-        new_vol = min(100, vm.get_volume() + 5)
-        vm.set_volume(new_vol)
-        print(f"Volume: {new_vol}%")
-    
-    elif cmd == "-":
-        new_vol = max(0, vm.get_volume() - 5)
-        vm.set_volume(new_vol)
-        print(f"Volume: {new_vol}%")
-    
-    elif cmd == "v" and arg:
-        try:
-            vol = int(arg)
-            vm.set_volume(vol)
-            print(f"Volume: {vm.get_volume()}%")
-        except ValueError:
-            print("Usage: v <0-100>")
-    
-    elif cmd == "m":
-        vm.toggle_mute()
-        if vm.is_muted():
-            print("Muted")
-        else:
-            print(f"Unmuted (Volume: {vm.get_volume()}%)")
-    
-    elif cmd == "a" and not arg:
-        tracks = vm.get_audio_tracks()
-        current = vm.get_current_audio_track()
-        print("\n  Audio Tracks:")
-        if tracks:
-            for tid, tname in tracks:
-                marker = " <-- current" if tid == current else ""
-                print(f"    [{tid}] {tname}{marker}")
+    except ValueError:
+        print("Usage: g% <0-100>")
+
+
+# ==================== AUDIO ====================
+
+def _cmd_volume_up(vm: VideoManager):
+    new_vol = min(100, vm.get_volume() + 5)
+    vm.set_volume(new_vol)
+    print(f"Volume: {new_vol}%")
+
+
+def _cmd_volume_down(vm: VideoManager):
+    new_vol = max(0, vm.get_volume() - 5)
+    vm.set_volume(new_vol)
+    print(f"Volume: {new_vol}%")
+
+
+def _cmd_set_volume(vm: VideoManager, arg: str):
+    try:
+        vol = int(arg)
+        vm.set_volume(vol)
+        print(f"Volume: {vm.get_volume()}%")
+    except ValueError:
+        print("Usage: v <0-100>")
+
+
+def _cmd_toggle_mute(vm: VideoManager):
+    vm.toggle_mute()
+    if vm.is_muted():
+        print("Muted")
+    else:
+        print(f"Unmuted (Volume: {vm.get_volume()}%)")
+
+
+def _cmd_list_audio_tracks(vm: VideoManager):
+    _print_tracks("Audio Tracks", vm.get_audio_tracks(), vm.get_current_audio_track())
+
+
+def _cmd_set_audio_track(vm: VideoManager, arg: str):
+    try:
+        track_id = int(arg)
+        if vm.set_audio_track(track_id):
+            print(f"Audio track set to {track_id}")
         else:
-            print("    (none available)")
-        print()
-    
-    elif cmd == "a" and arg:
+            print("Failed to set audio track")
+    except ValueError:
+        print("Usage: a <track_id>")
+
+
+def _cmd_audio_delay(vm: VideoManager, arg: str):
+    try:
+        delay = int(arg)
+        vm.set_audio_delay(delay)
+        print(f"Audio delay: {delay}ms")
+    except ValueError:
+        print("Usage: ad <milliseconds>")
+
+
+# ==================== SUBTITLES ====================
+
+def _cmd_list_subtitle_tracks(vm: VideoManager):
+    current = vm.get_current_subtitle_track()
+    _print_tracks("Subtitle Tracks", vm.get_subtitle_tracks(), current,
+                  f"  Current: {current} (-1 = disabled)")
+
+
+def _cmd_set_subtitle_track(vm: VideoManager, arg: str):
+    if arg == "off":
+        vm.disable_subtitles()
+        print("Subtitles disabled")
+    else:
         try:
             track_id = int(arg)
-            if vm.set_audio_track(track_id):
-                print(f"Audio track set to {track_id}")
+            if vm.set_subtitle_track(track_id):
+                print(f"Subtitle track set to {track_id}")
             else:
-                print("Failed to set audio track")
-        except ValueError:
-            print("Usage: a <track_id>")
-    
-    elif cmd == "ad" and arg:
-        try:
-            delay = int(arg)
-            vm.set_audio_delay(delay)
-            print(f"Audio delay: {delay}ms")
-        except ValueError:
-            print("Usage: ad <milliseconds>")
-    
-    # ==================== SUBTITLES ====================
-    elif cmd == "t" and not arg:
-        tracks = vm.get_subtitle_tracks()
-        current = vm.get_current_subtitle_track()
-        print("\n  Subtitle Tracks:")
-        if tracks:
-            for tid, tname in tracks:
-                marker = " <-- current" if tid == current else ""
-                print(f"    [{tid}] {tname}{marker}")
-        else:
-            print("    (none available)")
-        print(f"  Current: {current} (-1 = disabled)")
-        print()
-    
-    elif cmd == "t" and arg:
-        if arg == "off":
-            vm.disable_subtitles()
-            print("Subtitles disabled")
-        else:
-            try:
-                track_id = int(arg)
-                if vm.set_subtitle_track(track_id):
-                    print(f"Subtitle track set to {track_id}")
-                else:
-                    print("Failed to set subtitle track")
-            except ValueError:
-                print("Usage: t <track_id> or t off")
-    
-    elif cmd == "tl" and arg:
-        path = arg.strip().strip('"').strip("'")
-        if vm.load_subtitle_file(path):
-            print(f"Subtitle loaded: {path}")
-        else:
-            print(f"Failed to load subtitle: {path}")
-    
-    elif cmd == "td" and arg:
-        try:
-            delay = int(arg)
-            vm.set_subtitle_delay(delay)
-            print(f"Subtitle delay: {delay}ms")
+                print("Failed to set subtitle track")
         except ValueError:
-            print("Usage: td <milliseconds>")
-    
-    # ==================== SPEED ====================
-    elif cmd == "f":
-        new_speed = min(4.0, vm.get_playback_speed() + 0.25)
-        vm.set_playback_speed(new_speed)
-        print(f"Speed: {new_speed:.2f}x")
-    
-    elif cmd == "d":
-        new_speed = max(0.25, vm.get_playback_speed() - 0.25)
-        vm.set_playback_speed(new_speed)
-        print(f"Speed: {new_speed:.2f}x")
-    
-    elif cmd == "sp" and arg:
-        try:
-            rate = float(arg)
-            vm.set_playback_speed(rate)
-            print(f"Speed: {vm.get_playback_speed():.2f}x")
-        except ValueError:
-            print("Usage: sp <0.25-4.0>")
-    
-    elif cmd == "r":
-        vm.set_playback_speed(1.0)
-        print("Speed reset to 1.0x")
-    
-    # ==================== INFO & CONFIG ====================
-    elif cmd == "i":
-        print_status(vm)
-    
-    elif cmd == "info":
-        print_media_info(vm)
-    
-    elif cmd == "cfg":
-        print_config(vm)
-    
-    elif cmd == "recent":
-        print_recent_files(vm)
-    
-    # ==================== FILE OPERATIONS ====================
-    elif cmd == "o" and arg:
-        path = arg.strip().strip('"').strip("'")
-        try:
-            vm.stop()
-            vm.load(path)
-            print(f"Loaded: {path}")
-            vm.play()
-            print("Playing...")
-        except Exception as e:
-            print(f"Error: {e}")
-    
-    # ==================== OTHER ====================
-    elif cmd == "h":
-        print_help()
+            print("Usage: t <track_id> or t off")
+
+
+def _cmd_load_subtitle(vm: VideoManager, arg: str):
+    from core.videomanager import clean_source
+    path = clean_source(arg)
+    if vm.load_subtitle_file(path):
+        print(f"Subtitle loaded: {path}")
+    else:
+        print(f"Failed to load subtitle: {path}")
+
+
+def _cmd_subtitle_delay(vm: VideoManager, arg: str):
+    try:
+        delay = int(arg)
+        vm.set_subtitle_delay(delay)
+        print(f"Subtitle delay: {delay}ms")
+    except ValueError:
+        print("Usage: td <milliseconds>")
+
+
+# ==================== SPEED ====================
+
+def _cmd_faster(vm: VideoManager):
+    new_speed = min(4.0, vm.get_playback_speed() + 0.25)
+    vm.set_playback_speed(new_speed)
+    print(f"Speed: {new_speed:.2f}x")
+
+
+def _cmd_slower(vm: VideoManager):
+    new_speed = max(0.25, vm.get_playback_speed() - 0.25)
+    vm.set_playback_speed(new_speed)
+    print(f"Speed: {new_speed:.2f}x")
+
+
+def _cmd_set_speed(vm: VideoManager, arg: str):
+    try:
+        rate = float(arg)
+        vm.set_playback_speed(rate)
+        print(f"Speed: {vm.get_playback_speed():.2f}x")
+    except ValueError:
+        print("Usage: sp <0.25-4.0>")
+
+
+def _cmd_reset_speed(vm: VideoManager):
+    vm.set_playback_speed(1.0)
+    print("Speed reset to 1.0x")
+
+
+# ==================== FILE OPERATIONS ====================
+
+def _cmd_open(vm: VideoManager, arg: str):
+    from core.videomanager import clean_source
+    path = clean_source(arg)
+    try:
+        vm.stop()
+        vm.load(path)
+        print(f"Loaded: {path}")
+        vm.play()
+        print("Playing...")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+# ==================== OTHER ====================
+
+def _cmd_help(vm: VideoManager):
+    print_help()
+
+
+# Command -> handler, built once at import
+_COMMANDS = {
+    "p": _cmd_toggle_play,
+    "s": _cmd_stop,
+    "<": _cmd_skip_back,
+    ">": _cmd_skip_forward,
+    "<<": _cmd_skip_back_long,
+    ">>": _cmd_skip_forward_long,
+    "+": _cmd_volume_up,
+    "-": _cmd_volume_down,
+    "m": _cmd_toggle_mute,
+    "a": _cmd_list_audio_tracks,
+    "t": _cmd_list_subtitle_tracks,
+    "f": _cmd_faster,
+    "d": _cmd_slower,
+    "r": _cmd_reset_speed,
+    "i": print_status,
+    "info": print_media_info,
+    "cfg": print_config,
+    "recent": print_recent_files,
+    "h": _cmd_help,
+}
+
+_ARG_COMMANDS = {
+    "g": _cmd_goto,
+    "g%": _cmd_goto_percent,
+    "v": _cmd_set_volume,
+    "a": _cmd_set_audio_track,
+    "ad": _cmd_audio_delay,
+    "t": _cmd_set_subtitle_track,
+    "tl": _cmd_load_subtitle,
+    "td": _cmd_subtitle_delay,
+    "sp": _cmd_set_speed,
+    "o": _cmd_open,
+}
+
+
+def handle_command(vm: VideoManager, command: str) -> bool:
+    """
+    Handle a command. Returns False if should quit.
+    """
+    # Tabs separate command and argument too ("v\t50"); extra blanks are
+    # stripped from the argument
+    cmd, sep, arg = command.replace("\t", " ").partition(" ")
+    arg = arg.strip() if sep else None
     
-    elif cmd == "q":
+    if cmd == "q":
         return False
     
+    # Commands with an argument first ("a 2" selects, "a" lists)
+    if arg:
+        handler = _ARG_COMMANDS.get(cmd)
+        if handler is not None:
+            handler(vm, arg)
+            return True
+    
+    handler = _COMMANDS.get(cmd)
+    if handler is not None:
+        handler(vm)
     else:
         print(f"Unknown command: '{command}' (type 'h' for help)")
     
     return True
 
 
-def setup_event_handlers(vm: VideoManager):
-    """Setup event handlers for testing."""
+def setup_event_handlers(vm: VideoManager, messages: queue.SimpleQueue):
+    """
+    Setup event handlers for testing.
+    
+    Playback events arrive on VLC's thread, so messages for the user are
+    queued and printed by the command loop instead of racing the prompt.
+    """
     
     def on_ended():
-        print("\n[EVENT] Playback ended")
-        print(">> ", end="", flush=True)
+        messages.put(("event", "[EVENT] Playback ended"))
     
     def on_error(error):
-        print(f"\n[EVENT] Error: {error}")
-        print(">> ", end="", flush=True)
+        messages.put(("event", f"[EVENT] Error: {error}"))
     
     def on_state_changed(old_state, new_state):
-        logger.debug(f"State: {old_state.name} -> {new_state.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("State: %s -> %s", old_state.name, new_state.name)
     
     def on_buffering(percent):
-        if percent < 100:
-            logger.debug(f"Buffering: {percent}%")
+        if percent < 100 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Buffering: %s%%", percent)
     
     vm.on('on_ended', on_ended)
     vm.on('on_error', on_error)
@@ -389,6 +487,13 @@ def setup_event_handlers(vm: VideoManager):
     vm.on('on_buffering', on_buffering)
 
 
+def _read_commands(messages: queue.SimpleQueue):
+    """Reader thread: queue each stdin line, then None at end of input."""
+    for line in sys.stdin:
+        messages.put(("line", line))
+    messages.put(("line", None))
+
+
 def get_video_path_from_user(vm: VideoManager) -> str:
     """
     Get video path from user input, supporting recent file selection.
@@ -407,8 +512,8 @@ def get_video_path_from_user(vm: VideoManager) -> str:
             print(f"     {path}")
         print()
     
-    user_input = input("Enter path to video (or URL, or recent # 1-5): ").strip()
-    user_input = user_input.strip('"').strip("'")
+    from core.videomanager import clean_source
+    user_input = clean_source(input("Enter path to video (or URL, or recent # 1-5): "))
     
     # FIX: Check if user entered a number to select from recent files
     if recent and user_input.isdigit():
@@ -425,6 +530,15 @@ def get_video_path_from_user(vm: VideoManager) -> str:
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print(f"Usage: {os.path.basename(sys.argv[0])} [path or URL]")
+        print_help()
+        return
+    
+    # Initialize logging first
+    configure_logging(level="DEBUG", log_to_file=True, console_output=True)
+    from core.videomanager import VideoManager, clean_source
+    
     print("=" * 60)
     print("           AniVish Video Player - CLI Test Harness")
     print("=" * 60)
@@ -435,11 +549,12 @@ def main():
     vm = VideoManager()
     
     # Setup event handlers
-    setup_event_handlers(vm)
+    messages: queue.SimpleQueue = queue.SimpleQueue()
+    setup_event_handlers(vm, messages)
     
     # Get video path
     if len(sys.argv) > 1:
-        video_path = sys.argv[1]
+        video_path = clean_source(sys.argv[1])
     else:
         video_path = get_video_path_from_user(vm)
     
@@ -468,19 +583,28 @@ def main():
     
     print("\nType 'h' for help, 'q' to quit\n")
     
-    # Main command loop
+    # Main command loop: input lines and playback events share one queue
+    threading.Thread(target=_read_commands, args=(messages,), daemon=True).start()
+    print(">> ", end="", flush=True)
     while True:
         try:
-            command = input(">> ").strip().lower()
-        except (EOFError, KeyboardInterrupt):
+            kind, text = messages.get(timeout=0.5)  # Timeout keeps Ctrl+C responsive
+        except queue.Empty:
+            continue
+        except KeyboardInterrupt:
             print("\nQuitting...")
             break
         
-        if not command:
-            continue
-        
-        if not handle_command(vm, command):
+        if kind == "event":
+            print(f"\n{text}")
+        elif text is None:
+            print("\nQuitting...")
             break
+        else:
+            command = text.strip().lower()
+            if command and not handle_command(vm, command):
+                break
+        print(">> ", end="", flush=True)
     
     # Cleanup
     logger.info("Shutting down")